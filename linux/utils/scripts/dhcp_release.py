@@ -3,6 +3,8 @@
 
 """
 Send a DHCPRELEASE packet to the DHCP server to release the current DHCP IP address.
+With 'all' as the interface, release all DHCP configured interfaces from one
+socket and print the per-interface status in JSON.
 Compatible with Python 2.x and 3.x without external dependencies.
 """
 
@@ -14,20 +16,235 @@ import fcntl
 import glob
 import os
 import subprocess
+import json
 
-def get_default_interface():
-    # Try Linux /proc/net/route first
+# rtnetlink constants from linux/netlink.h and linux/rtnetlink.h
+NETLINK_ROUTE = 0
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+RTM_NEWADDR = 20
+RTM_GETADDR = 22
+RTM_NEWROUTE = 24
+RTM_GETROUTE = 26
+RT_TABLE_MAIN = 254
+RTN_UNICAST = 1
+RTA_OIF = 4
+RTA_GATEWAY = 5
+RTA_TABLE = 15
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_LABEL = 3
+IFA_F_PERMANENT = 0x80
+
+# DHCP server port which DHCPRELEASE packets are sent to
+DHCP_SERVER_PORT = 67
+
+NLMSG_HDR = struct.Struct('=LHHLL')
+RTMSG = struct.Struct('=BBBBBBBBL')
+IFADDRMSG = struct.Struct('=BBBBL')
+RTATTR = struct.Struct('=HH')
+
+# Directory of systemd-networkd lease files named by interface index
+NETWORKD_LEASE_DIR = '/run/systemd/netif/leases'
+
+# Block size used when reading lease files backwards
+LEASE_READ_BLOCK_SIZE = 4096
+
+
+def _nl_align(length):
+    return (length + 3) & ~3
+
+
+def _parse_rtattrs(data, offset, end):
+    """
+    Parse rtnetlink attributes into a dict of attribute type to payload
+    """
+    attrs = {}
+    while offset + RTATTR.size <= end:
+        rta_len, rta_type = RTATTR.unpack_from(data, offset)
+        if rta_len < RTATTR.size:
+            break
+        attrs[rta_type] = data[offset + RTATTR.size:offset + rta_len]
+        offset += _nl_align(rta_len)
+    return attrs
+
+
+def netlink_dump(msg_type, family=socket.AF_INET):
+    """
+    Send a rtnetlink dump request and return a list of (nlmsg_type, payload)
+    """
+    if not hasattr(socket, 'AF_NETLINK'):
+        return None
+
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
     try:
-        if os.path.exists('/proc/net/route'):
-            with open('/proc/net/route', 'r') as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) > 1 and parts[1] == '00000000':
-                        return parts[0]
+        sock.bind((0, 0))
+        # struct rtgenmsg is one byte of address family, padded to 4 bytes
+        body = struct.pack('=B3x', family)
+        seq = random.randint(1, 0x7FFFFFFF)
+        header = NLMSG_HDR.pack(NLMSG_HDR.size + len(body), msg_type,
+                                NLM_F_REQUEST | NLM_F_DUMP, seq, 0)
+        sock.sendall(header + body)
+
+        messages = []
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                return messages
+            offset = 0
+            while offset + NLMSG_HDR.size <= len(data):
+                nl_len, nl_type, nl_flags, nl_seq, nl_pid = NLMSG_HDR.unpack_from(data, offset)
+                if nl_len < NLMSG_HDR.size:
+                    return messages
+                if nl_seq == seq:
+                    if nl_type == NLMSG_DONE:
+                        return messages
+                    if nl_type == NLMSG_ERROR:
+                        return None
+                    messages.append((nl_type, data[offset + NLMSG_HDR.size:offset + nl_len]))
+                offset += _nl_align(nl_len)
+    finally:
+        sock.close()
+
+
+def netlink_get_routes():
+    """
+    Get IPv4 routes in the main table from rtnetlink.
+    Each route is a dict with 'dst_len', 'oif' and 'gateway'.
+    """
+    messages = netlink_dump(RTM_GETROUTE)
+    if messages is None:
+        return None
+
+    routes = []
+    for msg_type, payload in messages:
+        if msg_type != RTM_NEWROUTE or len(payload) < RTMSG.size:
+            continue
+        (family, dst_len, src_len, tos, table,
+         protocol, scope, rtm_type, flags) = RTMSG.unpack_from(payload, 0)
+        attrs = _parse_rtattrs(payload, RTMSG.size, len(payload))
+        if RTA_TABLE in attrs:
+            table = struct.unpack('=L', attrs[RTA_TABLE][:4])[0]
+        if family != socket.AF_INET or table != RT_TABLE_MAIN or rtm_type != RTN_UNICAST:
+            continue
+        route = {'dst_len': dst_len, 'oif': None, 'gateway': None}
+        if RTA_OIF in attrs:
+            route['oif'] = struct.unpack('=L', attrs[RTA_OIF][:4])[0]
+        if RTA_GATEWAY in attrs:
+            route['gateway'] = socket.inet_ntoa(attrs[RTA_GATEWAY][:4])
+        routes.append(route)
+    return routes
+
+
+def netlink_get_addresses():
+    """
+    Get IPv4 interface addresses from rtnetlink.
+    Each address is a dict with 'index', 'address', 'label' and 'flags'.
+    """
+    messages = netlink_dump(RTM_GETADDR)
+    if messages is None:
+        return None
+
+    addresses = []
+    for msg_type, payload in messages:
+        if msg_type != RTM_NEWADDR or len(payload) < IFADDRMSG.size:
+            continue
+        family, prefixlen, flags, scope, index = IFADDRMSG.unpack_from(payload, 0)
+        if family != socket.AF_INET:
+            continue
+        attrs = _parse_rtattrs(payload, IFADDRMSG.size, len(payload))
+        # IFA_LOCAL is the interface address, IFA_ADDRESS is the peer on point-to-point links
+        addr = attrs.get(IFA_LOCAL, attrs.get(IFA_ADDRESS))
+        if not addr:
+            continue
+        label = attrs.get(IFA_LABEL, b'').rstrip(b'\x00').decode('utf-8')
+        addresses.append({'index': index,
+                          'address': socket.inet_ntoa(addr[:4]),
+                          'label': label,
+                          'flags': flags})
+    return addresses
+
+
+def get_interface_index(ifname):
+    try:
+        return socket.if_nametoindex(ifname)
     except Exception:
         pass
-        
-    # Fallback for FreeBSD/macOS using netstat
+
+    try:
+        with open('/sys/class/net/%s/ifindex' % ifname, 'r') as f:
+            return int(f.read().strip())
+    except Exception:
+        return None
+
+
+def get_interface_name(index):
+    try:
+        return socket.if_indextoname(index)
+    except Exception:
+        pass
+
+    for ifindex_file in glob.glob('/sys/class/net/*/ifindex'):
+        try:
+            with open(ifindex_file, 'r') as f:
+                if int(f.read().strip()) == index:
+                    return ifindex_file.split('/')[-2]
+        except Exception:
+            continue
+    return None
+
+
+def get_netlink_default_route(ifname=None):
+    """
+    Get (interface, gateway) of the default route from rtnetlink
+    """
+    try:
+        routes = netlink_get_routes()
+    except Exception:
+        return None, None
+    if not routes:
+        return None, None
+
+    ifindex = None
+    if ifname:
+        ifindex = get_interface_index(ifname)
+        if ifindex is None:
+            return None, None
+
+    for route in routes:
+        if route['dst_len'] != 0 or route['oif'] is None:
+            continue
+        if ifindex is not None and route['oif'] != ifindex:
+            continue
+        return get_interface_name(route['oif']), route['gateway']
+    return None, None
+
+
+def get_proc_default_route(ifname=None):
+    """
+    Get (interface, gateway) of the default route from /proc/net/route
+    """
+    try:
+        with open('/proc/net/route', 'r') as f:
+            for line in f:
+                parts = line.strip().split()
+                if len(parts) > 2 and parts[1] == '00000000':
+                    if ifname and parts[0] != ifname:
+                        continue
+                    gateway = socket.inet_ntoa(struct.pack('<L', int(parts[2], 16)))
+                    return parts[0], gateway
+    except Exception:
+        pass
+    return None, None
+
+
+def get_netstat_default_route():
+    """
+    Get (interface, gateway) of the default route from 'netstat -rn', which is
+    only used as the last resort on FreeBSD/macOS
+    """
     try:
         output = subprocess.check_output(['netstat', '-rn']).decode('utf-8')
         for line in output.splitlines():
@@ -35,12 +252,39 @@ def get_default_interface():
             if len(parts) >= 4 and parts[0] == 'default':
                 # For FreeBSD/macOS, the interface is usually the 4th or 6th column
                 # Example: default 192.168.1.1 UGS em0
+                iface = None
                 for part in parts[3:]:
                     if not part.startswith('UG') and not part.replace('.', '').isdigit():
-                        return part
+                        iface = part
+                        break
+                # The gateway IP is usually the 2nd column
+                return iface, parts[1]
     except Exception:
         pass
-        
+    return None, None
+
+
+def get_default_interface():
+    # Try Linux rtnetlink and /proc/net/route first
+    for get_route in (get_netlink_default_route, get_proc_default_route):
+        iface, gateway = get_route()
+        if iface:
+            return iface
+
+    # Fallback for FreeBSD/macOS using netstat
+    iface, gateway = get_netstat_default_route()
+    return iface
+
+
+def get_default_gateway(ifname):
+    for get_route in (get_netlink_default_route, get_proc_default_route):
+        iface, gateway = get_route(ifname)
+        if iface and gateway and gateway != '0.0.0.0':
+            return gateway
+
+    iface, gateway = get_netstat_default_route()
+    if gateway and (not iface or iface == ifname):
+        return gateway
     return None
 
 def get_mac_address(iface):
@@ -65,6 +309,15 @@ def get_mac_address(iface):
     return None
 
 def get_ip_address(ifname):
+    # Try rtnetlink (Linux)
+    try:
+        ifindex = get_interface_index(ifname)
+        for addr in netlink_get_addresses() or []:
+            if addr['index'] == ifindex:
+                return addr['address']
+    except Exception:
+        pass
+
     # Try ioctl (Linux/macOS)
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
@@ -79,6 +332,8 @@ def get_ip_address(ifname):
         )[20:24])
     except Exception:
         pass
+    finally:
+        s.close()
         
     # Fallback for FreeBSD using ifconfig
     try:
@@ -92,127 +347,165 @@ def get_ip_address(ifname):
         
     return None
 
-def get_dhcp_server(ifname):
-    # 1. Try to find from common lease files (Linux & FreeBSD)
-    lease_patterns = [
+def read_lines_reverse(file_path, block_size=LEASE_READ_BLOCK_SIZE):
+    """
+    Yield lines of a file from the last one to the first one by reading
+    fixed size blocks from the end, so that callers stop reading as soon
+    as they find what they need
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            # The first line may be incomplete until the previous block is read
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode('utf-8', 'ignore')
+        yield remainder.decode('utf-8', 'ignore')
+
+def get_lease_patterns(ifname):
+    return [
         '/var/lib/dhcp/dhclient.%s.leases' % ifname,
         '/var/lib/dhcp/dhclient.leases',
         '/var/lib/dhclient/dhclient-%s.leases' % ifname,
         '/var/lib/dhclient/dhclient.leases',
-        '/var/lib/NetworkManager/dhclient-*.lease',
-        '/var/lib/NetworkManager/internal-*.lease',
+        # NetworkManager lease files are named by connection UUID and interface
+        '/var/lib/NetworkManager/dhclient-*-%s.lease' % ifname,
+        '/var/lib/NetworkManager/internal-*-%s.lease' % ifname,
         '/var/db/dhclient.leases.%s' % ifname  # FreeBSD
     ]
-    
-    actual_files = []
+
+def get_lease_file_server(lease_file, ifname=None):
+    """
+    Get the DHCP server of the newest lease in a dhclient or NetworkManager lease file.
+    With ifname, only the dhclient lease with 'interface "<ifname>";' is accepted,
+    because one dhclient lease file could have leases of multiple interfaces.
+    """
+    server = None
+    interface = None
+    try:
+        for line in read_lines_reverse(lease_file):
+            line = line.strip()
+            if line.startswith('SERVER_ADDRESS='):
+                return line.split('=', 1)[1].strip()
+            # Lines are read backwards, so '}' starts a lease and 'lease {' ends it
+            if line == '}':
+                server = None
+                interface = None
+            elif line.startswith('interface '):
+                interface = line.split(None, 1)[1].rstrip(';').strip('"')
+            elif line.startswith('option dhcp-server-identifier'):
+                server = line.split()[2].rstrip(';')
+            elif line.startswith('dhcp-server-identifier'):
+                server = line.split()[1].rstrip(';')
+            elif line.startswith('lease {'):
+                if server and (ifname is None or interface == ifname):
+                    return server
+                server = None
+                interface = None
+    except Exception:
+        pass
+    return None
+
+def get_lease_server(ifname, lease_patterns=None):
+    """
+    Get the DHCP server from lease files and systemd-networkd lease
+    """
+    if lease_patterns is None:
+        lease_patterns = get_lease_patterns(ifname)
+
+    # 1. Try to find from common lease files (Linux & FreeBSD)
     for pattern in lease_patterns:
-        actual_files.extend(glob.glob(pattern))
-        
-    for lf in actual_files:
-        try:
-            with open(lf, 'r') as f:
-                lines = f.readlines()
-                # Read backwards to get the latest lease
-                for line in reversed(lines):
-                    line = line.strip()
-                    if line.startswith('dhcp-server-identifier'):
-                        return line.split()[1].rstrip(';')
-        except Exception:
-            continue
-            
+        lease_files = glob.glob(pattern)
+        if len(lease_files) > 1:
+            # Check the most recently updated lease file firstly
+            lease_files.sort(key=lambda lf: os.path.getmtime(lf), reverse=True)
+        for lf in lease_files:
+            server = get_lease_file_server(lf, ifname)
+            if server:
+                return server
+
     # 2. Try systemd-networkd
     try:
-        idx = None
-        with open('/sys/class/net/%s/ifindex' % ifname, 'r') as f:
-            idx = f.read().strip()
-        if idx:
-            with open('/run/systemd/netif/leases/%s' % idx, 'r') as f:
+        idx = get_interface_index(ifname)
+        if idx is not None:
+            with open(os.path.join(NETWORKD_LEASE_DIR, str(idx)), 'r') as f:
                 for line in f:
                     if line.startswith('SERVER_ADDRESS='):
                         return line.split('=')[1].strip()
     except Exception:
         pass
 
+    return None
+
+def get_dhcp_server(ifname, lease_patterns=None):
+    server = get_lease_server(ifname, lease_patterns)
+    if server:
+        return server
+
     # 3. Fallback to default gateway
-    # Linux /proc/net/route
-    try:
-        if os.path.exists('/proc/net/route'):
-            with open('/proc/net/route', 'r') as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) > 2 and parts[1] == '00000000' and parts[0] == ifname:
-                        gw_hex = parts[2]
-                        return socket.inet_ntoa(struct.pack('<L', int(gw_hex, 16)))
-    except Exception:
-        pass
-        
-    # FreeBSD/macOS netstat
+    return get_default_gateway(ifname)
+
+def get_dhcp_interfaces():
+    """
+    Get the list of DHCP configured interfaces with their client IP, DHCP server
+    and MAC address. An interface is treated as DHCP configured when a lease
+    is found for it, or its address is a dynamic one without IFA_F_PERMANENT.
+    """
+    interfaces = []
+    addresses = None
     try:
-        output = subprocess.check_output(['netstat', '-rn']).decode('utf-8')
-        for line in output.splitlines():
-            parts = line.split()
-            if len(parts) >= 4 and parts[0] == 'default':
-                # The gateway IP is usually the 2nd column
-                return parts[1]
+        addresses = netlink_get_addresses()
     except Exception:
         pass
-        
-    return None
-
-def main():
-    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
-        print("Usage: %s [interface] [client_ip] [server_ip] [mac_address]" % sys.argv[0])
-        print("Example: %s" % sys.argv[0])
-        print("Example: %s eth0" % sys.argv[0])
-        print("Example: %s eth0 192.168.1.100 192.168.1.1 00:11:22:33:44:55" % sys.argv[0])
-        sys.exit(1)
+    if addresses is None:
+        # Fallback to list interfaces from /sys/class/net and query address with ioctl
+        addresses = []
+        for iface_path in sorted(glob.glob('/sys/class/net/*')):
+            iface = os.path.basename(iface_path)
+            client_ip = get_ip_address(iface)
+            if client_ip:
+                addresses.append({'index': get_interface_index(iface),
+                                  'address': client_ip,
+                                  'label': iface,
+                                  'flags': IFA_F_PERMANENT})
 
-    # Interface
-    if len(sys.argv) > 1 and sys.argv[1].lower() != 'auto':
-        iface = sys.argv[1]
-    else:
-        iface = get_default_interface()
-        if not iface:
-            print("Failed to auto-detect default interface. Please provide it manually.")
-            sys.exit(1)
-        print("Auto-detected default interface: %s" % iface)
-    
-    # Client IP
-    if len(sys.argv) >= 3 and sys.argv[2].lower() != 'auto':
-        client_ip = sys.argv[2]
-    else:
-        client_ip = get_ip_address(iface)
-        if not client_ip:
-            print("Failed to auto-detect IP address for interface %s. Please provide it manually." % iface)
-            sys.exit(1)
+    checked = set()
+    for addr in addresses:
+        iface = get_interface_name(addr['index']) or addr['label'].split(':')[0]
+        if not iface or iface in checked or addr['address'].startswith('127.'):
+            continue
+        checked.add(iface)
 
-    # Server IP
-    if len(sys.argv) >= 4 and sys.argv[3].lower() != 'auto':
-        server_ip = sys.argv[3]
-    else:
-        server_ip = get_dhcp_server(iface)
+        server_ip = get_lease_server(iface)
+        if not server_ip and not addr['flags'] & IFA_F_PERMANENT:
+            server_ip = get_default_gateway(iface)
         if not server_ip:
-            print("Failed to auto-detect DHCP server IP for interface %s. Please provide it manually." % iface)
-            sys.exit(1)
+            continue
 
-    # MAC Address
-    if len(sys.argv) >= 5 and sys.argv[4].lower() != 'auto':
-        mac_str = sys.argv[4]
-    else:
-        mac_str = get_mac_address(iface)
-        if not mac_str:
-            print("Failed to auto-detect MAC address for interface %s. Please provide it manually." % iface)
-            sys.exit(1)
+        interfaces.append({'interface': iface,
+                           'client_ip': addr['address'],
+                           'server_ip': server_ip,
+                           'mac': get_mac_address(iface)})
+    return interfaces
 
+def build_release_packet(client_ip, server_ip, mac_str):
+    """
+    Build a DHCPRELEASE packet. Raise ValueError for invalid IP or MAC address.
+    """
     # Parse MAC address
     try:
         mac_parts = [int(x, 16) for x in mac_str.split(':')]
         if len(mac_parts) != 6:
             raise ValueError("Invalid MAC length")
         mac_bytes = struct.pack('!6B', *mac_parts)
-    except Exception as e:
-        print("Invalid MAC address format: %s" % mac_str)
-        sys.exit(1)
+    except Exception:
+        raise ValueError("Invalid MAC address format: %s" % mac_str)
 
     # Build DHCP Release packet
     op = 1 # BOOTREQUEST
@@ -228,9 +521,9 @@ def main():
         yiaddr = socket.inet_aton('0.0.0.0')
         siaddr = socket.inet_aton('0.0.0.0')
         giaddr = socket.inet_aton('0.0.0.0')
+        server_id = socket.inet_aton(server_ip)
     except Exception as e:
-        print("Invalid IP address format: %s" % e)
-        sys.exit(1)
+        raise ValueError("Invalid IP address format: %s" % e)
 
     chaddr = mac_bytes + b'\x00' * 10
 
@@ -243,7 +536,7 @@ def main():
     opt53 = struct.pack('!3B', 53, 1, 7)
     
     # Option 54: Server Identifier
-    opt54 = struct.pack('!2B', 54, 4) + socket.inet_aton(server_ip)
+    opt54 = struct.pack('!2B', 54, 4) + server_id
     
     # Option 255: End
     opt255 = struct.pack('!B', 255)
@@ -267,16 +560,16 @@ def main():
     if len(packet) < 300:
         packet += b'\x00' * (300 - len(packet))
 
-    print("Preparing to send DHCPRELEASE:")
-    print("  Interface:  %s" % iface)
-    print("  Client IP:  %s" % client_ip)
-    print("  Server IP:  %s" % server_ip)
-    print("  MAC Addr:   %s" % mac_str)
+    return packet
 
-    # Send packet
-    sock = None
+def send_release_packets(releases, server_port=DHCP_SERVER_PORT):
+    """
+    Send DHCPRELEASE packets from one socket. Each release is a dict with
+    'interface', 'client_ip', 'server_ip' and 'mac', and its 'status' and
+    'msg' are updated with the sending result.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         
@@ -286,25 +579,123 @@ def main():
         except Exception:
             pass
 
-        # Try to bind to specific interface
-        try:
-            SO_BINDTODEVICE = 25
-            if sys.version_info[0] >= 3:
-                iface_bytes = iface.encode('utf-8')
-            else:
-                iface_bytes = iface
-            sock.setsockopt(socket.SOL_SOCKET, SO_BINDTODEVICE, iface_bytes + b'\x00')
-        except Exception:
-            pass
+        for release in releases:
+            try:
+                packet = build_release_packet(release['client_ip'],
+                                              release['server_ip'],
+                                              release['mac'] or '')
+            except ValueError as e:
+                release['status'] = 'failed'
+                release['msg'] = str(e)
+                continue
 
-        sock.sendto(packet, (server_ip, 67))
-        print("Successfully sent DHCPRELEASE packet.")
-    except Exception as e:
-        print("Error sending packet: %s" % e)
-        sys.exit(1)
+            # Try to bind to specific interface before sending
+            try:
+                SO_BINDTODEVICE = 25
+                if sys.version_info[0] >= 3:
+                    iface_bytes = release['interface'].encode('utf-8')
+                else:
+                    iface_bytes = release['interface']
+                sock.setsockopt(socket.SOL_SOCKET, SO_BINDTODEVICE, iface_bytes + b'\x00')
+            except Exception:
+                pass
+
+            try:
+                sock.sendto(packet, (release['server_ip'], server_port))
+                release['status'] = 'released'
+                release['msg'] = 'Successfully sent DHCPRELEASE packet.'
+            except Exception as e:
+                release['status'] = 'failed'
+                release['msg'] = 'Error sending packet: %s' % e
     finally:
-        if sock:
-            sock.close()
+        sock.close()
+
+    return releases
+
+def release_all():
+    """
+    Release DHCP IP addresses of all DHCP configured interfaces and print
+    the per-interface status in JSON
+    """
+    releases = send_release_packets(get_dhcp_interfaces())
+    print(json.dumps({'changed': len(releases) > 0,
+                      'interfaces': releases}, indent=4))
+    if any(release['status'] != 'released' for release in releases):
+        sys.exit(1)
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("Usage: %s [interface|all] [client_ip] [server_ip] [mac_address]" % sys.argv[0])
+        print("Example: %s" % sys.argv[0])
+        print("Example: %s eth0" % sys.argv[0])
+        print("Example: %s eth0 192.168.1.100 192.168.1.1 00:11:22:33:44:55" % sys.argv[0])
+        print("Example: %s all" % sys.argv[0])
+        sys.exit(1)
+
+    # Release all DHCP configured interfaces
+    if len(sys.argv) > 1 and sys.argv[1].lower() == 'all':
+        release_all()
+        return
+
+    # Interface
+    if len(sys.argv) > 1 and sys.argv[1].lower() != 'auto':
+        iface = sys.argv[1]
+    else:
+        iface = get_default_interface()
+        if not iface:
+            print("Failed to auto-detect default interface. Please provide it manually.")
+            sys.exit(1)
+        print("Auto-detected default interface: %s" % iface)
+    
+    # Client IP
+    if len(sys.argv) >= 3 and sys.argv[2].lower() != 'auto':
+        client_ip = sys.argv[2]
+    else:
+        client_ip = get_ip_address(iface)
+        if not client_ip:
+            print("Failed to auto-detect IP address for interface %s. Please provide it manually." % iface)
+            sys.exit(1)
+
+    # Server IP
+    if len(sys.argv) >= 4 and sys.argv[3].lower() != 'auto':
+        server_ip = sys.argv[3]
+    else:
+        server_ip = get_dhcp_server(iface)
+        if not server_ip:
+            print("Failed to auto-detect DHCP server IP for interface %s. Please provide it manually." % iface)
+            sys.exit(1)
+
+    # MAC Address
+    if len(sys.argv) >= 5 and sys.argv[4].lower() != 'auto':
+        mac_str = sys.argv[4]
+    else:
+        mac_str = get_mac_address(iface)
+        if not mac_str:
+            print("Failed to auto-detect MAC address for interface %s. Please provide it manually." % iface)
+            sys.exit(1)
+
+    release = {'interface': iface,
+               'client_ip': client_ip,
+               'server_ip': server_ip,
+               'mac': mac_str}
+
+    try:
+        build_release_packet(client_ip, server_ip, mac_str)
+    except ValueError as e:
+        print(str(e))
+        sys.exit(1)
+
+    print("Preparing to send DHCPRELEASE:")
+    print("  Interface:  %s" % iface)
+    print("  Client IP:  %s" % client_ip)
+    print("  Server IP:  %s" % server_ip)
+    print("  MAC Addr:   %s" % mac_str)
+
+    # Send packet
+    send_release_packets([release])
+    print(release['msg'])
+    if release['status'] != 'released':
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Collect Linux or FreeBSD guest OS system information in one run, which would
+otherwise be collected by many separate tasks, and print it in JSON.
+Compatible with Python 2.x and 3.x without external dependencies.
+
+The printed JSON has keys:
+  system: the lower case OS type, e.g. 'linux', 'freebsd'
+  os_release: the key values in /etc/os-release
+  os_release_content: the content of /etc/os-release
+  redhat_release: the content of /etc/redhat-release
+  system_release: the content of /etc/system-release
+  cloud_build_info: the content of /etc/cloud/build.info, or None if not exists
+  cloudinit_version: the cloud-init version
+  edition_packages: the installed packages to tell Ubuntu edition, or None if
+    packages can't be listed
+  network_services: the active states of NetworkManager and systemd-networkd
+  display_manager: the display manager name
+  display_manager_service: the display manager service name
+  display_manager_description: the display manager service description
+  display_manager_is_running: whether display manager is running
+  systemd_logind_service: the systemd-logind service name if it exists
+  systemd_logind_is_running: whether systemd-logind is running
+  login_sessions: the list of login sessions with keys 'Type' and 'Desktop'
+  x_server: the running X server process names on FreeBSD
+  cpu_num: the number of CPUs
+  cpu_cores: the number of cores per socket
+  firmware_is_efi: whether the system firmware is EFI
+"""
+
+import os
+import re
+import sys
+import json
+import platform
+import subprocess
+
+CLOUDINIT_BIN_PATH = '/usr/bin/cloud-init'
+UBUNTU_EDITION_PACKAGES = re.compile(r'linux-image-virtual|ubuntu-cloud-minimal|ubuntu-server|ubuntu-desktop')
+
+
+def run_cmd(cmd):
+    """
+    Run a shell command and return its exit code and output with stderr
+    """
+    try:
+        process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        output = process.communicate()[0]
+        return process.returncode, output.decode('utf-8', 'replace').strip()
+    except OSError:
+        return 127, ''
+
+
+def read_file(path):
+    """
+    Return file content, or None if the file can't be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read().decode('utf-8', 'replace')
+    except (IOError, OSError):
+        return None
+
+
+def parse_key_values(lines, separator='='):
+    """
+    Parse lines in format 'key=value' into a dict, and remove quotes around value
+    """
+    result = {}
+    for line in lines:
+        line = line.strip()
+        if not line or separator not in line or line.startswith('#'):
+            continue
+        key, value = line.split(separator, 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        result[key.strip()] = value
+    return result
+
+
+def systemd_unit_properties(unit, properties):
+    rc, output = run_cmd('systemctl show -p %s %s' % (' -p '.join(properties), unit))
+    if rc != 0:
+        return {}
+    return parse_key_values(output.splitlines())
+
+
+def get_os_release(info):
+    content = read_file('/etc/os-release') or ''
+    info['os_release_content'] = content
+    info['os_release'] = parse_key_values(content.splitlines())
+    info['redhat_release'] = (read_file('/etc/redhat-release') or '').strip()
+    info['system_release'] = (read_file('/etc/system-release') or '').strip()
+    info['cloud_build_info'] = read_file('/etc/cloud/build.info')
+
+
+def get_cloudinit_version(info):
+    info['cloudinit_version'] = ''
+    if os.path.exists(CLOUDINIT_BIN_PATH):
+        # Some OS might print cloud-init version to stderr
+        rc, output = run_cmd('%s --version' % CLOUDINIT_BIN_PATH)
+        if rc == 0:
+            info['cloudinit_version'] = output.replace(CLOUDINIT_BIN_PATH, '').strip()
+
+
+def get_edition_packages(info):
+    info['edition_packages'] = None
+    if info['os_release'].get('ID') != 'ubuntu' or info['cloud_build_info'] is not None:
+        return
+    rc, output = run_cmd("dpkg-query -W -f '${Package}\\n'")
+    if rc == 0 and output:
+        info['edition_packages'] = [pkg for pkg in output.splitlines()
+                                    if UBUNTU_EDITION_PACKAGES.search(pkg)]
+
+
+def get_linux_services(info):
+    info['network_services'] = {}
+    for service in ['NetworkManager', 'systemd-networkd']:
+        info['network_services'][service] = run_cmd('systemctl is-active %s' % service)[1]
+
+    logind = systemd_unit_properties('systemd-logind.service', ['LoadState', 'SubState'])
+    if logind.get('LoadState', 'not-found') != 'not-found':
+        info['systemd_logind_service'] = 'systemd-logind.service'
+        info['systemd_logind_is_running'] = logind.get('SubState') == 'running'
+
+    dm = systemd_unit_properties('display-manager.service',
+                                 ['LoadState', 'SubState', 'FragmentPath', 'Description'])
+    if dm.get('LoadState', 'not-found') != 'not-found' and dm.get('FragmentPath'):
+        dm_service = os.path.basename(dm['FragmentPath'])
+        info['display_manager'] = dm_service.split('.')[0]
+        info['display_manager_service'] = dm_service
+        info['display_manager_description'] = dm.get('Description', '')
+        info['display_manager_is_running'] = dm.get('SubState') == 'running'
+
+    if info['systemd_logind_is_running']:
+        rc, output = run_cmd("loginctl --no-legend list-sessions | awk '{print $1}'")
+        if rc == 0:
+            for session_id in output.split():
+                rc, session = run_cmd('loginctl -p Type -p Desktop show-session %s' % session_id)
+                if rc == 0:
+                    info['login_sessions'].append(parse_key_values(session.splitlines()))
+
+
+def get_freebsd_services(info):
+    rc, output = run_cmd("grep -io -E '^(gdm|slim|lightdm|sddm|xdm)_enable=.*YES' /etc/rc.conf")
+    if rc == 0 and output:
+        info['display_manager'] = output.splitlines()[0].split('_')[0]
+        rc, output = run_cmd('service %s status' % info['display_manager'])
+        info['display_manager_is_running'] = rc == 0 and 'is running' in output
+    rc, output = run_cmd("pgrep -l 'Xorg|Xwayland'")
+    if rc == 0:
+        info['x_server'] = output
+
+
+def get_cpu_info(info):
+    if info['system'] == 'linux':
+        rc, output = run_cmd('lscpu')
+        if rc == 0:
+            lscpu = parse_key_values(output.splitlines(), separator=':')
+            info['cpu_num'] = lscpu.get('CPU(s)', '')
+            info['cpu_cores'] = lscpu.get('Core(s) per socket', '')
+        info['firmware_is_efi'] = os.path.exists('/sys/firmware/efi')
+    elif info['system'] == 'freebsd':
+        info['cpu_num'] = run_cmd('sysctl -n hw.ncpu')[1]
+        rc, output = run_cmd('dmesg | grep SMP | grep package')
+        if rc == 0 and output:
+            info['cpu_cores'] = output.split(':')[-1].split('core')[0].split()[-1]
+        info['firmware_is_efi'] = run_cmd('kldstat -m efirt')[0] == 0
+
+
+def main():
+    info = {'system': platform.system().lower(),
+            'display_manager': '',
+            'display_manager_service': '',
+            'display_manager_description': '',
+            'display_manager_is_running': False,
+            'systemd_logind_service': '',
+            'systemd_logind_is_running': False,
+            'login_sessions': [],
+            'network_services': {},
+            'x_server': '',
+            'cpu_num': '',
+            'cpu_cores': '',
+            'firmware_is_efi': False}
+    get_os_release(info)
+    get_cloudinit_version(info)
+    get_edition_packages(info)
+    if info['system'] == 'linux':
+        get_linux_services(info)
+    elif info['system'] == 'freebsd':
+        get_freebsd_services(info)
+    get_cpu_info(info)
+    print(json.dumps(info, indent=4, sort_keys=True))
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        sys.stderr.write('Failed to collect guest system info: %s\n' % e)
+        sys.exit(1)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Pack files and folders matching the given paths or glob patterns into one
+gzip compressed tar archive, so that they can be fetched from guest OS at once.
+Files are added into the archive with their base names, and a file whose base
+name has been added is added with its full path joined by '_'.
+Compatible with Python 2.x and 3.x without external dependencies.
+
+Usage:
+  pack_files.py <archive_path> <path_or_glob> [<path_or_glob> ...]
+
+The printed JSON manifest has keys:
+  archive: the archive path
+  size: the archive size in bytes
+  collected: the list of packed files or folders with keys 'src', 'name' and 'size'
+  missing: the list of paths or glob patterns which match nothing
+  failed: the list of paths failed to be packed with keys 'src' and 'error'
+"""
+
+import os
+import sys
+import glob
+import json
+import tarfile
+
+
+def path_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if os.path.isfile(file_path):
+                size += os.path.getsize(file_path)
+    return size
+
+
+def pack_files(archive_path, patterns):
+    manifest = {'archive': archive_path,
+                'size': 0,
+                'collected': [],
+                'missing': [],
+                'failed': []}
+    names = set()
+    archive = tarfile.open(archive_path, 'w:gz')
+    try:
+        for pattern in patterns:
+            paths = sorted(glob.glob(pattern))
+            if not paths:
+                manifest['missing'].append(pattern)
+                continue
+            for path in paths:
+                name = os.path.basename(path.rstrip('/'))
+                if name in names:
+                    name = path.strip('/').replace('/', '_')
+                try:
+                    archive.add(path, arcname=name)
+                except (IOError, OSError) as e:
+                    manifest['failed'].append({'src': path, 'error': str(e)})
+                    continue
+                names.add(name)
+                manifest['collected'].append({'src': path, 'name': name, 'size': path_size(path)})
+    finally:
+        archive.close()
+    manifest['size'] = os.path.getsize(archive_path)
+    return manifest
+
+
+def main():
+    if len(sys.argv) < 3:
+        sys.stderr.write('Usage: %s <archive_path> <path_or_glob> [<path_or_glob> ...]\n' % sys.argv[0])
+        sys.exit(1)
+    print(json.dumps(pack_files(sys.argv[1], sys.argv[2:]), indent=4))
+
+
+if __name__ == '__main__':
+    main()
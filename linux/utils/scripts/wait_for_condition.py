@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Wait in guest OS until all given conditions are met or timeout, so that a wait
+takes one guest OS task instead of one task per poll.
+Compatible with Python 2.x and 3.x without external dependencies.
+
+Conditions can be:
+  count:<glob>:<number>   the number of paths matching glob pattern equals to number
+  path:<path>             the path exists
+  process:<name>          a process with the name is running
+  service:<name>:<state>  the output of 'systemctl status <name>' contains the state,
+                          e.g. 'active', 'inactive', 'running'
+
+Usage:
+  wait_for_condition.py -c <condition> [-c <condition> ...] [-t <timeout>] [-i <interval>]
+
+The printed JSON has keys:
+  satisfied: whether all conditions are met
+  elapsed: the seconds waited
+  conditions: the list of conditions with keys 'condition', 'satisfied' and
+    'value', which is the last checked value, e.g. the number of matched paths
+The exit code is 0 if all conditions are met, otherwise 1.
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import subprocess
+from argparse import ArgumentParser
+
+
+def parse_arguments():
+    parser = ArgumentParser(description="Wait until all conditions are met in guest OS")
+    parser.add_argument("-c", dest="conditions", action="append", required=True,
+                        help="the condition to wait for, which can be 'count:<glob>:<number>', "
+                             "'path:<path>', 'process:<name>' or 'service:<name>:<state>'")
+    parser.add_argument("-t", dest="timeout", type=float, default=60,
+                        help="the timeout in seconds. Default is 60")
+    parser.add_argument("-i", dest="interval", type=float, default=0.5,
+                        help="the interval in seconds between checks. Default is 0.5")
+    return parser.parse_args()
+
+
+def run_cmd(cmd):
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output = process.communicate()[0]
+        return process.returncode, output.decode('utf-8', 'replace')
+    except OSError:
+        return 127, ''
+
+
+def check_count(pattern, number):
+    value = len(glob.glob(pattern))
+    return value == int(number), value
+
+
+def check_path(path):
+    return os.path.exists(path), os.path.exists(path)
+
+
+def check_process(name):
+    rc, output = run_cmd(['pgrep', '-x', name])
+    pids = output.split() if rc == 0 else []
+    return len(pids) > 0, pids
+
+
+def check_service(name, state):
+    output = run_cmd(['systemctl', 'status', name])[1]
+    match = re.search(r'Active:\s*(.*)', output)
+    return re.search('[^a-z]' + state, output) is not None, match.group(1).strip() if match else ''
+
+
+CHECKERS = {'count': (check_count, 2),
+            'path': (check_path, 1),
+            'process': (check_process, 1),
+            'service': (check_service, 2)}
+
+
+def parse_condition(condition):
+    kind, _, args = condition.partition(':')
+    if kind not in CHECKERS:
+        raise ValueError("Unknown condition '%s'" % condition)
+    checker, nargs = CHECKERS[kind]
+    # The glob pattern or path could contain ':', so split arguments from right
+    args = args.rsplit(':', nargs - 1) if nargs > 1 else [args]
+    if len(args) != nargs or not all(args):
+        raise ValueError("Invalid condition '%s'" % condition)
+    return checker, args
+
+
+def wait_for_conditions(conditions, timeout, interval):
+    checks = [(condition, parse_condition(condition)) for condition in conditions]
+    start_time = time.time()
+    while True:
+        results = []
+        for condition, (checker, args) in checks:
+            satisfied, value = checker(*args)
+            results.append({'condition': condition, 'satisfied': satisfied, 'value': value})
+        elapsed = time.time() - start_time
+        satisfied = all(result['satisfied'] for result in results)
+        if satisfied or elapsed >= timeout:
+            return {'satisfied': satisfied,
+                    'elapsed': round(elapsed, 3),
+                    'conditions': results}
+        time.sleep(min(interval, max(timeout - elapsed, 0)))
+
+
+def main():
+    args = parse_arguments()
+    try:
+        result = wait_for_conditions(args.conditions, args.timeout, args.interval)
+    except ValueError as e:
+        sys.stderr.write('%s\n' % e)
+        sys.exit(2)
+    print(json.dumps(result, indent=4))
+    sys.exit(0 if result['satisfied'] else 1)
+
+
+if __name__ == '__main__':
+    main()
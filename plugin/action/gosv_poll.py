@@ -0,0 +1,130 @@
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+""" Ansible vSphere GOS Validation Poll Action Plugin """
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+import random
+
+from ansible.errors import AnsibleError, AnsibleUndefinedVariable
+from ansible.module_utils.common.text.converters import to_text
+from ansible.playbook.conditional import Conditional
+from ansible.plugins.action import ActionBase
+from ansible.utils.display import Display
+
+display = Display()
+
+DOCUMENTATION = '''
+    name: gosv_poll
+    short_description: Run a module repeatedly until conditions are met or deadline is reached
+    description:
+      - This action runs a module at once, and re-runs it with exponential backoff
+        delays until all conditions in 'until' are met, or the deadline of 'timeout'
+        seconds is reached.
+      - Unlike task keywords 'retries' and 'delay', a fast event is detected by the
+        first probes without waiting for a full interval, and a slow event is polled
+        less frequently to reduce the load of vCenter Server or ESXi host.
+    options:
+      module:
+        description: The module name to run, e.g. community.vmware.vmware_guest_info.
+        required: true
+      module_args:
+        description: The arguments of the module.
+        default: {}
+      until:
+        description:
+          - The conditions of module result to be met, in the same format of task keyword 'until'.
+          - The module result is referred with the registered variable name of this task,
+            or 'poll_result' when this task is not registered.
+        required: true
+      timeout:
+        description: The seconds to wait for conditions are met.
+        default: 300
+      initial_delay:
+        description: The seconds to delay before the first retry.
+        default: 1
+      max_delay:
+        description: The maximum seconds to delay between two retries.
+        default: 30
+      backoff:
+        description: The factor to multiply the delay by after each retry.
+        default: 2
+      jitter:
+        description: The fraction of delay to randomly add or subtract, to avoid polling in lockstep.
+        default: 0.2
+'''
+
+RETURN = '''
+    attempts:
+      description: The times the module was run.
+    elapsed:
+      description: The seconds waited until conditions were met or the deadline was reached.
+'''
+
+
+class ActionModule(ActionBase):
+
+    _VALID_ARGS = frozenset(('module', 'module_args', 'until', 'timeout', 'initial_delay',
+                             'max_delay', 'backoff', 'jitter'))
+
+    def _conditions_met(self, conditional, result, task_vars):
+        all_vars = dict(task_vars)
+        all_vars[self._task.register or 'poll_result'] = result
+        try:
+            return conditional.evaluate_conditional(self._templar, all_vars)
+        except (AnsibleError, AnsibleUndefinedVariable) as e:
+            display.vvv("gosv_poll: failed to evaluate conditions: %s" % to_text(e))
+            return False
+
+    def run(self, tmp=None, task_vars=None):
+        if task_vars is None:
+            task_vars = dict()
+
+        super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module = self._task.args.get('module')
+        module_args = self._task.args.get('module_args') or {}
+        until = self._task.args.get('until')
+        if not module or not until:
+            return {'failed': True, 'msg': "Parameters 'module' and 'until' are required"}
+
+        try:
+            timeout = float(self._task.args.get('timeout', 300))
+            delay = float(self._task.args.get('initial_delay', 1))
+            max_delay = float(self._task.args.get('max_delay', 30))
+            backoff = float(self._task.args.get('backoff', 2))
+            jitter = float(self._task.args.get('jitter', 0.2))
+        except (TypeError, ValueError) as e:
+            return {'failed': True, 'msg': "Invalid polling parameter: %s" % to_text(e)}
+
+        conditional = Conditional(loader=self._loader)
+        conditional.when = until if isinstance(until, list) else [until]
+
+        start_time = time.time()
+        deadline = start_time + timeout
+        attempts = 0
+        while True:
+            attempts += 1
+            result = self._execute_module(module_name=module, module_args=module_args,
+                                          task_vars=task_vars)
+            if self._conditions_met(conditional, result, task_vars):
+                break
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                result['failed'] = True
+                if not result.get('msg'):
+                    result['msg'] = "Timed out waiting for conditions are met in %d seconds" % timeout
+                break
+
+            sleep_time = min(delay * random.uniform(1 - jitter, 1 + jitter), remaining)
+            display.vvv("gosv_poll: attempt %d of %s does not meet conditions, retry in %.1f seconds" %
+                        (attempts, module, sleep_time))
+            time.sleep(sleep_time)
+            delay = min(delay * backoff, max_delay)
+
+        result['attempts'] = attempts
+        result['elapsed'] = round(time.time() - start_time, 1)
+        return result
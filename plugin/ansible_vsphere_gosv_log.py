@@ -28,6 +28,13 @@ DOCUMENTATION = '''
       - This callback writes detail running log and test results to log file.
 '''
 
+# Use libyaml based loader when it's available, which is much faster than
+# the pure Python loader
+try:
+    from yaml import CLoader as YamlLoader
+except ImportError:
+    from yaml import Loader as YamlLoader
+
 if sys.version_info.major == 2:
     reload(sys)
     sys.setdefaultencoding('utf8')
@@ -74,6 +81,192 @@ def extract_error_msg(json_obj):
 
     return message
 
+# Parsed YAML files cache in format of {real_path: ((mtime, size), data)}
+_yaml_files_cache = {}
+
+def load_yaml_file(file_path):
+    """
+    Load YAML file and cache the parsed data with its real path as key.
+    The file is parsed again only when its modification time or size changes.
+    """
+    real_path = os.path.realpath(file_path)
+    file_stat = os.stat(real_path)
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _yaml_files_cache.get(real_path)
+    if cached and cached[0] == file_version:
+        return cached[1]
+
+    with open(real_path, 'r') as fd:
+        data = yaml.load(fd, Loader=YamlLoader)
+    _yaml_files_cache[real_path] = (file_version, data)
+    return data
+
+def format_test_results(test_runs, total_exec_time):
+    """
+    Format test results in a table with test summary, which is also used for
+    merging test results of multiple test runs
+    :param test_runs: an ordered dict of test case id to TestRun
+    :param total_exec_time: elapsed time in seconds
+    :return: test results message
+    """
+    total_count = len(test_runs)
+
+    # Get the column width
+    idx_col_width = max([len(str(total_count)), 2])
+    name_col_width = max([len(test_result.name) for test_result in test_runs.values()])
+    status_col_width = max([(len(test_result.status) + 2)
+                            if test_result.status != "Passed"
+                            else len(test_result.status)
+                            for test_result in test_runs.values()])
+
+    status_mark = ""
+    if status_col_width > len('passed'):
+        status_mark = "  "
+
+    row_border = "+{}+\n".format("".ljust(idx_col_width + name_col_width + status_col_width + 20, "-"))
+    row_format = "| {:<} | {:<} | {:<} | {:<9} |\n"
+
+    # Table head
+    msg = row_border
+    msg += row_format.format("ID",
+                             "Name".ljust(name_col_width),
+                             (status_mark + "Status").ljust(status_col_width),
+                             "Exec Time")
+    msg += row_border
+
+    # Set align character for test case index
+    if len(str(total_count)) == 1:
+        align_char = ' '
+    else:
+        align_char = '0'
+
+    # Table rows
+    status_stats = OrderedDict([('Passed', 0), ('Failed', 0), ('Blocked', 0), ('Skipped', 0), ('No Run', 0)])
+    test_idx = 0
+    for test_id in test_runs:
+        test_result = test_runs[test_id]
+        test_idx += 1
+        test_exec_time = time.strftime('%H:%M:%S', time.gmtime(test_result.duration))
+        if test_result.status == 'Passed':
+            msg += row_format.format(str(test_idx).rjust(idx_col_width, align_char),
+                                     test_result.name.ljust(name_col_width),
+                                     (status_mark + test_result.status).ljust(status_col_width),
+                                     test_exec_time)
+            status_stats[test_result.status] += 1
+        else:
+            msg += row_format.format(str(test_idx).rjust(idx_col_width, align_char),
+                                     test_result.name.ljust(name_col_width),
+                                     ("* " + test_result.status).ljust(status_col_width),
+                                     test_exec_time)
+            if test_result.status in ['Failed', 'Blocked', 'No Run']:
+                status_stats[test_result.status] += 1
+            else:
+                status_stats['Skipped'] += 1
+
+    msg += row_border
+
+    # Test summary
+    test_summary = "Test Results (Total: " + str(total_count)
+    for key in status_stats:
+        if status_stats[key] > 0:
+            test_summary += ", {}: {}".format(key, status_stats[key])
+
+    test_summary += ", Elapsed Time: {})\n".format(time.strftime("%H:%M:%S", time.gmtime(total_exec_time)))
+
+    return test_summary + msg
+
+def format_diagnostics_artifacts(artifacts, elapsed):
+    """
+    Format VM diagnostics artifacts collected at test case failure in a table
+    with each artifact's status and duration
+    :param artifacts: a list of artifacts returned by module gosv_vm_diagnostics
+    :param elapsed: elapsed time in seconds of collecting all artifacts
+    :return: diagnostics artifacts message
+    """
+    name_col_width = max([len(artifact['name']) for artifact in artifacts] + [len('Artifact')])
+    status_col_width = max([len(artifact['status']) for artifact in artifacts] + [len('Status')])
+    row_format = "| {} | {} | {:>8} | {}\n"
+    row_border = "+{}+\n".format("".ljust(name_col_width + status_col_width + 17, "-"))
+
+    msg = "VM Diagnostics (Total: {}, Elapsed Time: {}s)\n".format(len(artifacts), elapsed)
+    msg += row_border
+    msg += row_format.format("Artifact".ljust(name_col_width),
+                             "Status".ljust(status_col_width),
+                             "Duration",
+                             "Path or Message")
+    msg += row_border
+    for artifact in artifacts:
+        msg += row_format.format(artifact['name'].ljust(name_col_width),
+                                 artifact['status'].ljust(status_col_width),
+                                 "{}s".format(artifact['duration']),
+                                 artifact['path'] or artifact['msg'])
+    msg += row_border
+    return msg
+
+
+def block_dependent_test_runs(test_runs, playbooks, blocked=False):
+    """
+    Set status of not run test cases to 'Blocked' when the resources they require
+    are provided by failed or blocked test cases, according to 'testcase_requires'
+    and 'testcase_provides' vars of test cases in test case list file
+    :param test_runs: an ordered dict of test case id to TestRun
+    :param playbooks: the test cases loaded from test case list file
+    :param blocked: True to block all not run test cases, e.g. env_setup failed
+    :return:
+    """
+    failed_resources = set()
+    for index, test_run in enumerate(test_runs.values()):
+        testcase_vars = {}
+        if index < len(playbooks):
+            testcase_vars = playbooks[index].get('vars') or {}
+        if (test_run.status == 'No Run' and
+                (blocked or failed_resources.intersection(testcase_vars.get('testcase_requires') or []))):
+            test_run.status = 'Blocked'
+
+        if test_run.status in ['Failed', 'Blocked']:
+            failed_resources.update(testcase_vars.get('testcase_provides') or [])
+
+def merge_test_results(results_files, testcase_file):
+    """
+    Merge test results of multiple test runs, e.g. the shards of a test case list
+    running on cloned VMs in parallel, in the order of test cases in testcase_file
+    :param results_files: the test results JSON files dumped by test runs
+    :param testcase_file: the test case list file of all test runs
+    :return: an ordered dict of test case id to TestRun, and elapsed time in seconds
+    """
+    results_by_name = {}
+    start_times = []
+    end_times = []
+    for results_file in results_files:
+        if not os.path.exists(results_file):
+            continue
+        with open(results_file, 'r') as fd:
+            test_results = json.load(fd)
+        if test_results.get('start_time'):
+            start_times.append(test_results['start_time'])
+        if test_results.get('end_time'):
+            end_times.append(test_results['end_time'])
+        for test_run_dict in test_results.get('test_runs', []):
+            # Test case id is composed by <index>_<test_case_name>
+            test_name = test_run_dict['id'].split('_', 1)[-1]
+            results_by_name.setdefault(test_name, []).append(TestRun.from_dict(test_run_dict))
+
+    merged_test_runs = OrderedDict()
+    playbooks = load_yaml_file(testcase_file)
+    for index, playbook in enumerate(playbooks):
+        test_name = os.path.basename(playbook['import_playbook']).replace('.yml', '')
+        test_id = "{}_{}".format(str(index+1).rjust(len(str(len(playbooks))), '0'), test_name)
+        if results_by_name.get(test_name):
+            merged_test_runs[test_id] = results_by_name[test_name].pop(0)
+            merged_test_runs[test_id].id = test_id
+        else:
+            merged_test_runs[test_id] = TestRun(test_id, test_name)
+
+    elapsed_time = 0
+    if start_times and end_times:
+        elapsed_time = int(max(end_times) - min(start_times))
+    return merged_test_runs, elapsed_time
+
 class vSphereInfo(object):
     def __init__(self, product, hostname):
         self.product = product
@@ -390,11 +583,22 @@ class TestRun(object):
         self.start_time = None
         self.duration = 0
     def __str__(self):
-        return str({"id": self.id,
-                    "name": self.name,
-                    "status": self.status,
-                    "start_time": self.start_time,
-                    "duration": self.duration})
+        return str(self.to_dict())
+
+    def to_dict(self):
+        return {"id": self.id,
+                "name": self.name,
+                "status": self.status,
+                "start_time": self.start_time,
+                "duration": self.duration}
+
+    @classmethod
+    def from_dict(cls, test_run_dict):
+        test_run = cls(test_run_dict['id'], test_run_dict['name'])
+        test_run.status = test_run_dict.get('status', 'No Run')
+        test_run.start_time = test_run_dict.get('start_time')
+        test_run.duration = test_run_dict.get('duration', 0)
+        return test_run
 
     def start(self):
         self.start_time = time.time()
@@ -434,6 +638,8 @@ class CallbackModule(CallbackBase):
         self.failed_tasks_log = "failed_tasks.log"
         self.known_issues_log = "known_issues.log"
         self.test_results_log = "results.log"
+        self.test_results_json_file = "test_results.json"
+        self.checkpoint_file = "checkpoint.json"
         self.guest_info_json_file = "guest_info.json"
         self.collected_guest_info = {}
 
@@ -442,6 +648,11 @@ class CallbackModule(CallbackBase):
         self.testing_testcase_file = None
         self.testing_vars = {}
 
+        # The checkpoint file of previous test run to resume from, and the ids
+        # of test cases completed in previous test run
+        self.resume_checkpoint_file = None
+        self.resumed_testcases = []
+
         # The play name and path of current playbook
         self._play_name = None
         self._play_path = None
@@ -724,13 +935,11 @@ class CallbackModule(CallbackBase):
                 if 'testing_vars_file' in vars_file:
                     # Update testing vars with testing_vars_file
                     if self.testing_vars_file and os.path.exists(self.testing_vars_file):
-                        with open(self.testing_vars_file, 'r') as fd:
-                            self.testing_vars.update(yaml.load(fd, Loader=yaml.Loader))
+                        self.testing_vars.update(load_yaml_file(self.testing_vars_file) or {})
                 else:
                     vars_file_path = os.path.join(os.path.dirname(play_path), vars_file)
                     if os.path.exists(vars_file_path):
-                        with open(vars_file_path, 'r') as fd:
-                            self.testing_vars.update(yaml.load(fd, Loader=yaml.Loader))
+                        self.testing_vars.update(load_yaml_file(vars_file_path) or {})
 
     # Get all of test cases at play start and set status to "No Run"
     def _get_testcase_list(self, testcase_file_path):
@@ -738,15 +947,14 @@ class CallbackModule(CallbackBase):
             self.logger.error("Test cases file {} doesn't exist".format(testcase_file_path))
             return
 
-        with open(testcase_file_path, 'r') as fd:
-            playbooks = yaml.load(fd, Loader=yaml.Loader)
-            self.testcases_count = len(playbooks)
-            for index, playbook in enumerate(playbooks):
-                test_name = os.path.basename(playbook['import_playbook']).replace('.yml', '')
-                test_id = "{}_{}".format(str(index+1).rjust(len(str(self.testcases_count)), '0'), test_name)
-                # print("DEBUG: Get test id: {}".format(test_id))
-                self.test_runs[test_id] = TestRun(test_id, test_name)
-                self.not_completed_testcases.append(test_name)
+        playbooks = load_yaml_file(testcase_file_path)
+        self.testcases_count = len(playbooks)
+        for index, playbook in enumerate(playbooks):
+            test_name = os.path.basename(playbook['import_playbook']).replace('.yml', '')
+            test_id = "{}_{}".format(str(index+1).rjust(len(str(self.testcases_count)), '0'), test_name)
+            # print("DEBUG: Get test id: {}".format(test_id))
+            self.test_runs[test_id] = TestRun(test_id, test_name)
+            self.not_completed_testcases.append(test_name)
 
     def _get_play_path(self, play):
         path = ""
@@ -790,61 +998,18 @@ class CallbackModule(CallbackBase):
             self._display.display(msg, color=C.COLOR_VERBOSE)
             return
 
-        # Block test cases when deploy_vm or installing tools failed
-        testcase_blocked = False
-        if self._play_name == 'env_setup':
-            # Test cases are blocked by env_setup failure
-            testcase_blocked = True
-
-        blocker_pattern = r'deploy_vm|ovt_verify_.*_install|wintools_complete_install_verify'
-        for test_id in self.test_runs:
-            if (self.test_runs[test_id].status in ['Failed', 'Blocked'] and
-                re.search(blocker_pattern, self.test_runs[test_id].name)):
-                testcase_blocked = True
-                continue
-
-            # For test cases after blocker, set their status to 'Blocked'
-            if testcase_blocked and self.test_runs[test_id].status == 'No Run':
-                self.test_runs[test_id].status = 'Blocked'
-
-
-        # Get the column width
-        idx_col_width = max([len(str(total_count)), 2])
-        name_col_width = max([len(test_result.name) for test_result in self.test_runs.values()])
-        status_col_width = max([(len(test_result.status) + 2)
-                                if test_result.status != "Passed"
-                                else len(test_result.status)
-                                for test_result in self.test_runs.values()])
+        # Block test cases when their required resources failed to be provided,
+        # or all test cases are blocked by env_setup failure
+        playbooks = []
+        if self.testing_testcase_file and os.path.exists(self.testing_testcase_file):
+            playbooks = load_yaml_file(self.testing_testcase_file) or []
+        block_dependent_test_runs(self.test_runs, playbooks,
+                                  blocked=(self._play_name == 'env_setup'))
 
-        status_mark = ""
-        if status_col_width > len('passed'):
-            status_mark = "  "
-
-        row_border = "+{}+\n".format("".ljust(idx_col_width + name_col_width + status_col_width + 20, "-"))
-        row_format = "| {:<} | {:<} | {:<} | {:<9} |\n"
-
-        # Table head
-        msg = row_border
-        msg += row_format.format("ID",
-                                 "Name".ljust(name_col_width),
-                                 (status_mark + "Status").ljust(status_col_width),
-                                 "Exec Time")
-        msg += row_border
-
-        # Set align character for test case index
-        if len(str(total_count)) == 1:
-            align_char = ' '
-        else:
-            align_char = '0'
-
-        # Table rows
-        status_stats = OrderedDict([('Passed', 0), ('Failed', 0), ('Blocked', 0), ('Skipped', 0), ('No Run', 0)])
-        test_idx = 0
-        for test_id in self.test_runs:
-            test_result = self.test_runs[test_id]
+        # Update deploy_vm test case name
+        for test_result in self.test_runs.values():
             if (str(self.testing_vars.get('new_vm', False)).lower() == 'true' and
                 test_result.name == 'deploy_vm'):
-                # Update deploy_vm test case name
                 if self.testing_vars.get('vm_deploy_method', '') == 'ova':
                     if self.testing_testcase_file and 'windows' in self.testing_testcase_file:
                         test_result.name = 'deploy_vm_ovf'
@@ -858,37 +1023,85 @@ class CallbackModule(CallbackBase):
                                                                    self.testing_vars['boot_disk_controller'].lower(),
                                                                    self.testing_vars['network_adapter_type'].lower())
 
-            test_idx += 1
-            test_exec_time = time.strftime('%H:%M:%S', time.gmtime(test_result.duration))
-            if test_result.status == 'Passed':
-                msg += row_format.format(str(test_idx).rjust(idx_col_width, align_char),
-                                         test_result.name.ljust(name_col_width),
-                                         (status_mark + test_result.status).ljust(status_col_width),
-                                         test_exec_time)
-                status_stats[test_result.status] += 1
-            else:
-                msg += row_format.format(str(test_idx).rjust(idx_col_width, align_char),
-                                         test_result.name.ljust(name_col_width),
-                                         ("* " + test_result.status).ljust(status_col_width),
-                                         test_exec_time)
-                if test_result.status in ['Failed', 'Blocked', 'No Run']:
-                    status_stats[test_result.status] += 1
-                else:
-                    status_stats['Skipped'] += 1
+        msg = format_test_results(self.test_runs, total_exec_time)
+        self.logger.info(msg)
+        self._display.display(msg, color=C.COLOR_VERBOSE)
 
-        msg += row_border
+    def _dump_test_results(self):
+        """
+        Dump test results into a json file, which can be merged with test results
+        of other test runs
+        """
+        json_file_path = os.path.join(self.log_dir, self.test_results_json_file)
+        test_results = {'start_time': self.start_time,
+                        'end_time': self.end_time,
+                        'testing_testcase_file': self.testing_testcase_file,
+                        'test_runs': [test_run.to_dict() for test_run in self.test_runs.values()]}
+        with open(json_file_path, 'w') as json_file:
+            json.dump(test_results, json_file, indent=4)
+
+    def _get_resume_checkpoint_file(self, resume_from_log):
+        """
+        Get the checkpoint file path from a log folder or checkpoint file path
+        of previous test run
+        """
+        if not resume_from_log:
+            return None
+        # Resolve the log folder before 'current' link is updated for this test run
+        resume_from_log = os.path.realpath(resume_from_log)
+        if os.path.isdir(resume_from_log):
+            return os.path.join(resume_from_log, self.checkpoint_file)
+        return resume_from_log
+
+    def _load_checkpoint(self):
+        """
+        Restore test case results completed without failure and collected facts
+        from the checkpoint of previous test run
+        """
+        if not self.resume_checkpoint_file or not os.path.exists(self.resume_checkpoint_file):
+            self._display.display("Checkpoint file {} doesn't exist. Test cases will not be resumed.".format(
+                                  self.resume_checkpoint_file), color=C.COLOR_WARN)
+            return
 
-        # Test summary
-        test_summary = "Test Results (Total: " + str(total_count)
-        for key in status_stats:
-            if status_stats[key] > 0:
-                test_summary += ", {}: {}".format(key, status_stats[key])
+        with open(self.resume_checkpoint_file, 'r') as fd:
+            checkpoint = json.load(fd)
 
-        test_summary += ", Elapsed Time: {})\n".format(time.strftime("%H:%M:%S", time.gmtime(total_exec_time)))
+        for test_run_dict in checkpoint.get('test_runs', []):
+            test_id = test_run_dict['id']
+            if (test_id in self.test_runs and
+                    test_run_dict['status'] not in ['Failed', 'Blocked', 'No Run', 'Running']):
+                self.test_runs[test_id] = TestRun.from_dict(test_run_dict)
+                self.resumed_testcases.append(test_id)
 
-        msg = test_summary + msg
-        self.logger.info(msg)
-        self._display.display(msg, color=C.COLOR_VERBOSE)
+        self._ansible_gosv_facts.update(checkpoint.get('gosv_facts', {}))
+        self._display.display("Resume from checkpoint {}, {} test cases completed in previous test run".format(
+                              self.resume_checkpoint_file, len(self.resumed_testcases)),
+                              color=C.COLOR_DEBUG)
+
+    def _dump_checkpoint(self):
+        """
+        Dump test case results and collected facts into a checkpoint file after each
+        test case, so that an interrupted test run can be resumed with 'resume_from_log'.
+        The file is replaced atomically to avoid a partial checkpoint.
+        """
+        if not self.log_dir or not os.path.exists(self.log_dir) or len(self.test_runs) == 0:
+            return
+
+        checkpoint = {'testing_vars_file': self.testing_vars_file,
+                      'testing_testcase_file': self.testing_testcase_file,
+                      'vm_name': self.testing_vars.get('vm_name', ''),
+                      'base_snapshot_name': self._ansible_gosv_facts.get('base_snapshot_name',
+                                                                         self.testing_vars.get('base_snapshot_name', '')),
+                      'vm_guest_ip': self._ansible_gosv_facts.get('vm_guest_ip', ''),
+                      'test_runs': [test_run.to_dict() for test_run in self.test_runs.values()],
+                      'gosv_facts': self._ansible_gosv_facts}
+        checkpoint_file_path = os.path.join(self.log_dir, self.checkpoint_file)
+        tmp_file_path = checkpoint_file_path + ".tmp"
+        with open(tmp_file_path, 'w') as fd:
+            json.dump(checkpoint, fd, indent=4, default=str)
+            fd.flush()
+            os.fsync(fd.fileno())
+        os.rename(tmp_file_path, checkpoint_file_path)
 
     def _print_os_release_info(self):
         """
@@ -997,9 +1210,12 @@ class CallbackModule(CallbackBase):
         task_file = os.path.basename(task.get_path()).split(':')[0].strip()
         if ((task_file in ["create_local_log_path.yml",
                            "set_current_testcase_facts.yml",
+                           "set_default_testing_vars.yml",
+                           "set_new_vm_user_account.yml",
                            "vcenter_get_version_build.yml",
                            "esxi_get_version_build.yml",
                            "esxi_get_model.yml",
+                           "load_testbed_facts_cache.yml",
                            "vm_get_vm_info.yml",
                            "vm_upgrade_hardware_version.yml",
                            "vm_get_guest_info.yml",
@@ -1066,6 +1282,12 @@ class CallbackModule(CallbackBase):
         # Collect ansible_facts from set_fact or debug modules
         self._collect_ansible_gosv_facts(result)
 
+        # Print status and duration of VM diagnostics artifacts
+        if str(task.action).endswith('gosv_vm_diagnostics') and task_result.get('artifacts'):
+            msg = format_diagnostics_artifacts(task_result['artifacts'], task_result.get('elapsed', 0))
+            self.logger.info(msg)
+            self._display.display(msg, color=C.COLOR_VERBOSE)
+
         # Set skipped test case result
         task_file = os.path.basename(task.get_path()).split(':')[0].strip()
         if (task_file == "skip_test_case.yml" and
@@ -1172,8 +1394,11 @@ class CallbackModule(CallbackBase):
             self.testing_vars_file = os.path.join(self.cwd, "vars/test.yml")
         # Load testing vars
         if os.path.exists(self.testing_vars_file):
-            with open(self.testing_vars_file, 'r') as fd:
-                self.testing_vars.update(yaml.load(fd, Loader=yaml.Loader))
+            self.testing_vars.update(load_yaml_file(self.testing_vars_file) or {})
+
+        # Get checkpoint file of previous test run to resume from
+        self.resume_checkpoint_file = self._get_resume_checkpoint_file(
+            extra_vars.get('resume_from_log', self.testing_vars.get('resume_from_log', '')))
 
         # Update log dir
         self._set_log_dir(self.testing_vars.get('local_log_path', ''))
@@ -1186,6 +1411,8 @@ class CallbackModule(CallbackBase):
             else:
                 self.testing_testcase_file = os.path.join(self.cwd, "linux/gosv_testcase_list.yml")
             self._get_testcase_list(self.testing_testcase_file)
+            if self.resume_checkpoint_file:
+                self._load_checkpoint()
 
         self.add_logger_file_handler(self.full_debug_log)
         msg = self._banner("PLAYBOOK: {}".format(playbook_path))
@@ -1207,6 +1434,9 @@ class CallbackModule(CallbackBase):
             # Pop up the completed test case
             self.not_completed_testcases.pop(0)
 
+        # Save test results of completed test cases
+        self._dump_checkpoint()
+
         # Move to new started playbook
         self._last_test_id = None
         self._play_name = play.get_name()
@@ -1222,7 +1452,11 @@ class CallbackModule(CallbackBase):
             self._last_test_id = "{}_{}".format(str(test_index+1).rjust(len(str(self.testcases_count)), '0'),
                                                 self._play_name)
 
-            if self._last_test_id in self.test_runs:
+            if self._last_test_id in self.resumed_testcases:
+                # Test case completed in previous test run will not run again
+                self.not_completed_testcases.pop(0)
+                self._last_test_id = None
+            elif self._last_test_id in self.test_runs:
                 self.test_runs[self._last_test_id].start()
             else:
                 self._last_test_id = None
@@ -1254,6 +1488,7 @@ class CallbackModule(CallbackBase):
             self.test_runs[self._last_test_id].complete('Passed')
             # Pop up the completed test case
             self.not_completed_testcases.pop(0)
+        self._dump_checkpoint()
 
         # Log play stats
         msg = self._banner("PLAY RECAP")
@@ -1304,6 +1539,9 @@ class CallbackModule(CallbackBase):
             self._print_test_results()
             self.remove_logger_file_handler(self.test_results_log)
 
+            # Dump test results into a json file
+            self._dump_test_results()
+
         if ('testrun_log_path' in self._ansible_gosv_facts and
             self._ansible_gosv_facts['testrun_log_path'] and
             self.log_dir != self._ansible_gosv_facts['testrun_log_path']):
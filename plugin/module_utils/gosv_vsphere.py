@@ -0,0 +1,81 @@
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+""" Ansible vSphere GOS Validation vSphere Connection Module Utils """
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ssl
+
+try:
+    from pyVmomi import vim
+    from pyVim.connect import SmartConnect, Disconnect
+    HAS_PYVMOMI = True
+except ImportError:
+    HAS_PYVMOMI = False
+
+from ansible.module_utils.basic import env_fallback
+from ansible.module_utils.common.text.converters import to_native
+
+
+def vsphere_argument_spec(**kwargs):
+    """
+    Get argument spec of vCenter Server or ESXi host connection options
+    :return: the argument spec updated with module options in kwargs
+    """
+    argument_spec = dict(
+        hostname=dict(type='str', required=True),
+        username=dict(type='str', required=True),
+        password=dict(type='str', required=True, no_log=True),
+        port=dict(type='int', default=443, fallback=(env_fallback, ['VMWARE_PORT'])),
+        validate_certs=dict(type='bool', default=False),
+    )
+    argument_spec.update(kwargs)
+    return argument_spec
+
+
+def connect_vsphere(module):
+    """
+    Connect to vCenter Server or ESXi host, and fail module if connection failed
+    :return: the service instance
+    """
+    ssl_context = None
+    if not module.params['validate_certs']:
+        ssl_context = ssl._create_unverified_context()
+
+    try:
+        return SmartConnect(host=module.params['hostname'],
+                            user=module.params['username'],
+                            pwd=module.params['password'],
+                            port=module.params['port'],
+                            sslContext=ssl_context)
+    except Exception as e:
+        module.fail_json(msg="Failed to connect %s: %s" % (module.params['hostname'], to_native(e)))
+
+
+def disconnect_vsphere(si):
+    Disconnect(si)
+
+
+def find_vm(content, name, folder=None):
+    if folder:
+        vm = content.searchIndex.FindByInventoryPath(folder.strip('/') + '/' + name)
+        return [vm] if isinstance(vm, vim.VirtualMachine) else []
+
+    view = content.viewManager.CreateContainerView(content.rootFolder, [vim.VirtualMachine], True)
+    try:
+        return [vm for vm in view.view if vm.name == name]
+    finally:
+        view.Destroy()
+
+
+def get_vm(module, si):
+    """
+    Get the VM with module options 'name' and 'folder', and fail module if not only one VM found
+    :return: the VM object
+    """
+    vms = find_vm(si.content, module.params['name'], module.params['folder'])
+    if len(vms) != 1:
+        module.fail_json(msg="Found %d VMs with name '%s'%s" %
+                         (len(vms), module.params['name'],
+                          " in folder '%s'" % module.params['folder'] if module.params['folder'] else ''))
+    return vms[0]
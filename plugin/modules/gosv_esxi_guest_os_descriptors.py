@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+""" Ansible vSphere GOS Validation ESXi Guest OS Descriptors Module """
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+    module: gosv_esxi_guest_os_descriptors
+    short_description: Get all guest OS descriptors of a hardware version on ESXi host
+    description:
+      - This module queries VM config option of a hardware version on ESXi host once,
+        and returns guest full name and other options of all guest IDs in it, instead
+        of querying VM config option for each guest ID.
+    options:
+      hostname:
+        description: The vCenter Server or ESXi host name or IP address.
+        required: true
+      username:
+        description: The username of vCenter Server or ESXi host.
+        required: true
+      password:
+        description: The password of vCenter Server or ESXi host.
+        required: true
+      port:
+        description:
+          - The port of vCenter Server or ESXi host.
+          - If not set, the value of environment variable VMWARE_PORT will be used.
+        default: 443
+      validate_certs:
+        description: Whether to validate server certificate.
+        default: false
+      esxi_hostname:
+        description:
+          - The ESXi host name in vCenter Server.
+          - If not set, there must be only one ESXi host in inventory.
+      hardware_version:
+        description: The hardware version, e.g. 21 or 'vmx-21'.
+        required: true
+'''
+
+EXAMPLES = '''
+- name: "Get guest OS descriptors of hardware version 21"
+  gosv_esxi_guest_os_descriptors:
+    hostname: "{{ vsphere_host_name }}"
+    username: "{{ vsphere_host_user }}"
+    password: "{{ vsphere_host_user_password }}"
+    esxi_hostname: "{{ esxi_hostname }}"
+    hardware_version: 21
+'''
+
+RETURN = '''
+    guest_ids:
+      description: The list of all guest IDs in the order of guest OS descriptors.
+    guest_os_descriptors:
+      description:
+        - The dict of guest IDs and their options with keys 'guest_id', 'guest_fullname',
+          'guest_family', 'support_for_create' and 'hardware_version'.
+'''
+
+try:
+    from pyVmomi import vim, vmodl
+    HAS_PYVMOMI = True
+except ImportError:
+    HAS_PYVMOMI = False
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.gosv_vsphere import vsphere_argument_spec, connect_vsphere, disconnect_vsphere
+
+
+def find_host(content, esxi_hostname=None):
+    view = content.viewManager.CreateContainerView(content.rootFolder, [vim.HostSystem], True)
+    try:
+        if esxi_hostname:
+            return [host for host in view.view if host.name == esxi_hostname]
+        return list(view.view)
+    finally:
+        view.Destroy()
+
+
+def get_guest_os_descriptors(host, hardware_version):
+    """
+    Query VM config option of the hardware version on ESXi host with all guest OS descriptors
+    :return: the list of guest IDs, and the dict of guest IDs and their options
+    """
+    spec = vim.EnvironmentBrowser.ConfigOptionQuerySpec(key=hardware_version, host=host)
+    config_option = host.parent.environmentBrowser.QueryConfigOptionEx(spec)
+
+    guest_ids = []
+    descriptors = {}
+    for descriptor in config_option.guestOSDescriptor if config_option else []:
+        # The first descriptor of a guest ID is used
+        if not descriptor.id or descriptor.id in descriptors:
+            continue
+        guest_ids.append(descriptor.id)
+        descriptors[descriptor.id] = dict(guest_id=descriptor.id,
+                                          guest_fullname=descriptor.fullName,
+                                          guest_family=descriptor.family,
+                                          support_for_create=descriptor.supportedForCreate,
+                                          hardware_version=hardware_version)
+    return guest_ids, descriptors
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=vsphere_argument_spec(
+            esxi_hostname=dict(type='str'),
+            hardware_version=dict(type='str', required=True),
+        ),
+        supports_check_mode=True,
+    )
+
+    if not HAS_PYVMOMI:
+        module.fail_json(msg=missing_required_lib('pyvmomi'))
+
+    hardware_version = module.params['hardware_version']
+    if not hardware_version.startswith('vmx-'):
+        hardware_version = 'vmx-%s' % hardware_version
+
+    si = connect_vsphere(module)
+
+    try:
+        hosts = find_host(si.content, module.params['esxi_hostname'])
+        if len(hosts) != 1:
+            module.fail_json(msg="Found %d ESXi hosts%s" %
+                             (len(hosts),
+                              " with name '%s'" % module.params['esxi_hostname']
+                              if module.params['esxi_hostname'] else ''))
+
+        guest_ids, descriptors = get_guest_os_descriptors(hosts[0], hardware_version)
+        if not guest_ids:
+            module.fail_json(msg="No guest OS descriptor is found for hardware version %s" % hardware_version)
+        module.exit_json(changed=False, guest_ids=guest_ids, guest_os_descriptors=descriptors)
+    except vmodl.MethodFault as e:
+        module.fail_json(msg=to_native(e.msg))
+    finally:
+        disconnect_vsphere(si)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/python
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+""" Ansible vSphere GOS Validation VM Failure Diagnostics Module """
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+    module: gosv_vm_diagnostics
+    short_description: Collect VM diagnostics artifacts concurrently within a time budget
+    description:
+      - This module collects independent VM diagnostics artifacts at test case failure,
+        which are VM properties, VM console screenshot and VM files in datastore,
+        e.g. VMX file and vmware.log, in parallel threads with one vSphere session.
+      - All artifacts share one time budget. An artifact not collected within the
+        time budget is reported with status 'timeout', and it doesn't block others.
+      - The module doesn't fail when an artifact fails to be collected. The status,
+        duration and local path of each artifact are returned.
+    options:
+      hostname:
+        description: The vCenter Server or ESXi host name or IP address.
+        required: true
+      username:
+        description: The username of vCenter Server or ESXi host.
+        required: true
+      password:
+        description: The password of vCenter Server or ESXi host.
+        required: true
+      port:
+        description:
+          - The port of vCenter Server or ESXi host.
+          - If not set, the value of environment variable VMWARE_PORT will be used.
+        default: 443
+      validate_certs:
+        description: Whether to validate server certificate.
+        default: false
+      datacenter:
+        description:
+          - The datacenter name of the VM.
+          - If not set, it is the name of the datacenter which the VM belongs to.
+      name:
+        description: The VM name.
+        required: true
+      folder:
+        description:
+          - The VM folder path, e.g. '/DC0/vm' or '/DC0/vm/sub_folder'.
+          - If not set, VM is searched by name in whole inventory.
+      dest_dir:
+        description: The local folder to save artifacts.
+        required: true
+      properties:
+        description:
+          - The VM property paths to dump into 'vm_properties.json'.
+          - Set it to an empty list to not collect VM properties.
+        default: ['config', 'guest', 'summary']
+      screenshot:
+        description: Whether to take VM console screenshot when VM is powered on.
+        default: true
+      screenshot_name:
+        description:
+          - The local file name of the VM console screenshot.
+          - If not set, it is the screenshot file name in datastore.
+      datastore_files:
+        description:
+          - The file names in VM folder of datastore to download.
+          - If not set, the VMX file and vmware.log will be downloaded.
+      timeout:
+        description: The seconds of the time budget for collecting all artifacts.
+        default: 300
+'''
+
+EXAMPLES = '''
+- name: "Collect VM diagnostics at test case failure"
+  gosv_vm_diagnostics:
+    hostname: "{{ vsphere_host_name }}"
+    username: "{{ vsphere_host_user }}"
+    password: "{{ vsphere_host_user_password }}"
+    datacenter: "{{ vsphere_host_datacenter }}"
+    folder: "{{ vm_folder }}"
+    name: "{{ vm_name }}"
+    dest_dir: "{{ current_test_log_folder }}"
+    screenshot_name: "screenshot_at_{{ current_testcase_index }}_{{ ansible_play_name }}.png"
+    timeout: 300
+'''
+
+RETURN = '''
+    artifacts:
+      description:
+        - The list of artifacts with keys 'name', 'status', 'duration', 'path' and 'msg'.
+        - The status can be 'success', 'failed', 'skipped' or 'timeout'.
+        - The path is the local file path of the artifact if it is collected.
+    vm_power_state:
+      description: The VM power state when collecting artifacts.
+    elapsed:
+      description: The seconds taken to collect all artifacts.
+'''
+
+import os
+import json
+import time
+import shutil
+import socket
+import threading
+
+try:
+    from urllib.parse import quote, urlencode
+except ImportError:
+    from urllib import quote, urlencode
+
+try:
+    from pyVmomi import vim, vmodl
+    from pyVmomi.VmomiJSONEncoder import VmomiJSONEncoder
+    HAS_PYVMOMI = True
+except ImportError:
+    HAS_PYVMOMI = False
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.gosv_vsphere import vsphere_argument_spec, connect_vsphere, disconnect_vsphere, get_vm
+from ansible.module_utils.urls import open_url
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def get_datacenter_name(vm):
+    parent = vm.parent or vm.parentVApp
+    while parent is not None and not isinstance(parent, vim.Datacenter):
+        parent = parent.parent
+    return parent.name if parent is not None else 'ha-datacenter'
+
+
+def split_datastore_path(datastore_path):
+    """
+    Split datastore path '[datastore] folder/file' into datastore name and file path
+    """
+    datastore, _, file_path = datastore_path.partition(']')
+    return datastore.lstrip('['), file_path.strip()
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class Artifact(object):
+    """
+    An artifact collected in a thread, which records its own status and duration
+    """
+    def __init__(self, name, collect, *args):
+        self.name = name
+        self.status = 'timeout'
+        self.duration = 0
+        self.path = ''
+        self.msg = ''
+        self._start_time = None
+        self._thread = threading.Thread(target=self._run, args=(collect,) + args)
+        # Don't wait for timed out artifacts when module exits
+        self._thread.daemon = True
+
+    def _run(self, collect, *args):
+        try:
+            result = collect(*args)
+            if isinstance(result, tuple):
+                self.status, self.msg = result
+            else:
+                self.status, self.path = 'success', result
+        except (BudgetExceeded, socket.timeout) as e:
+            self.status, self.msg = 'timeout', to_native(e) or 'Timed out'
+        except Exception as e:
+            self.status, self.msg = 'failed', to_native(e)
+        self.duration = round(time.time() - self._start_time, 1)
+
+    def start(self):
+        self._start_time = time.time()
+        self._thread.start()
+
+    def join(self, deadline):
+        self._thread.join(max(deadline - time.time(), 0))
+        if self._thread.is_alive():
+            self.duration = round(time.time() - self._start_time, 1)
+            self.msg = 'Not collected within the time budget'
+
+    def to_dict(self):
+        return dict(name=self.name, status=self.status, duration=self.duration,
+                    path=self.path, msg=self.msg)
+
+
+class VmDiagnostics(object):
+    def __init__(self, module, si, vm, deadline):
+        self.module = module
+        self.params = module.params
+        self.si = si
+        self.vm = vm
+        self.deadline = deadline
+        self.datacenter = self.params['datacenter'] or get_datacenter_name(vm)
+
+    def remaining(self):
+        remaining = self.deadline - time.time()
+        if remaining <= 0:
+            raise BudgetExceeded('Not collected within the time budget')
+        return remaining
+
+    def download_datastore_file(self, datastore, file_path, local_name):
+        """
+        Download file from datastore with HTTP GET of its datastore file URL,
+        and write it to a temporary file before renaming it to the local name
+        """
+        url = 'https://%s:%d/folder/%s?%s' % (self.params['hostname'], self.params['port'],
+                                              quote(file_path),
+                                              urlencode({'dcPath': self.datacenter, 'dsName': datastore}))
+        local_path = os.path.join(self.params['dest_dir'], local_name)
+        tmp_path = local_path + '.part'
+        response = open_url(url, method='GET',
+                            url_username=self.params['username'],
+                            url_password=self.params['password'],
+                            force_basic_auth=True,
+                            validate_certs=self.params['validate_certs'],
+                            timeout=self.remaining())
+        try:
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response, f, COPY_BUFFER_SIZE)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            response.close()
+        os.rename(tmp_path, local_path)
+        return local_path
+
+    def collect_properties(self, paths):
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=self.vm, skip=False)],
+            propSet=[vmodl.query.PropertyCollector.PropertySpec(type=vim.VirtualMachine,
+                                                                all=False,
+                                                                pathSet=paths)])
+        result = self.si.content.propertyCollector.RetrievePropertiesEx(
+            [filter_spec], vmodl.query.PropertyCollector.RetrieveOptions())
+        properties = dict((path, None) for path in paths)
+        for obj in result.objects if result else []:
+            for prop in obj.propSet or []:
+                properties[prop.name] = prop.val
+
+        local_path = os.path.join(self.params['dest_dir'], 'vm_properties.json')
+        with open(local_path, 'w') as f:
+            json.dump(properties, f, cls=VmomiJSONEncoder, strip_dynamic=True,
+                      indent=4, sort_keys=True)
+        return local_path
+
+    def collect_screenshot(self):
+        task = self.vm.CreateScreenshot_Task()
+        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
+            self.remaining()
+            time.sleep(1)
+        if task.info.state == vim.TaskInfo.State.error:
+            raise Exception(to_native(task.info.error.msg))
+
+        datastore, file_path = split_datastore_path(task.info.result)
+        return self.download_datastore_file(datastore, file_path,
+                                            self.params['screenshot_name'] or os.path.basename(file_path))
+
+    def collect_datastore_file(self, datastore, file_path):
+        return self.download_datastore_file(datastore, file_path, os.path.basename(file_path))
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=vsphere_argument_spec(
+            datacenter=dict(type='str'),
+            name=dict(type='str', required=True),
+            folder=dict(type='str'),
+            dest_dir=dict(type='path', required=True),
+            properties=dict(type='list', elements='str', default=['config', 'guest', 'summary']),
+            screenshot=dict(type='bool', default=True),
+            screenshot_name=dict(type='str'),
+            datastore_files=dict(type='list', elements='str'),
+            timeout=dict(type='int', default=300),
+        ),
+        supports_check_mode=False,
+    )
+
+    if not HAS_PYVMOMI:
+        module.fail_json(msg=missing_required_lib('pyvmomi'))
+
+    if not os.path.isdir(module.params['dest_dir']):
+        module.fail_json(msg="Local folder '%s' doesn't exist" % module.params['dest_dir'])
+
+    start_time = time.time()
+    deadline = start_time + module.params['timeout']
+    si = connect_vsphere(module)
+
+    try:
+        vm = get_vm(module, si)
+        diagnostics = VmDiagnostics(module, si, vm, deadline)
+        power_state = str(vm.runtime.powerState)
+        datastore, vmx_path = split_datastore_path(vm.config.files.vmPathName)
+        vm_dir = os.path.dirname(vmx_path)
+        datastore_files = module.params['datastore_files']
+        if datastore_files is None:
+            datastore_files = [os.path.basename(vmx_path), 'vmware.log']
+
+        artifacts = []
+        if module.params['properties']:
+            artifacts.append(Artifact('vm_properties.json', diagnostics.collect_properties,
+                                      module.params['properties']))
+        if module.params['screenshot']:
+            if power_state == 'poweredOn':
+                artifacts.append(Artifact('screenshot', diagnostics.collect_screenshot))
+            else:
+                artifacts.append(Artifact('screenshot', lambda: (
+                    'skipped', "Can't take screenshot when VM is %s" % power_state)))
+        for file_name in datastore_files:
+            artifacts.append(Artifact(file_name, diagnostics.collect_datastore_file,
+                                      datastore, '/'.join([vm_dir, file_name]).lstrip('/')))
+
+        for artifact in artifacts:
+            artifact.start()
+        for artifact in artifacts:
+            artifact.join(deadline)
+
+        module.exit_json(changed=any(artifact.path for artifact in artifacts),
+                         artifacts=[artifact.to_dict() for artifact in artifacts],
+                         vm_power_state=power_state,
+                         elapsed=round(time.time() - start_time, 1))
+    except vmodl.MethodFault as e:
+        module.fail_json(msg=to_native(e.msg))
+    finally:
+        disconnect_vsphere(si)
+
+
+if __name__ == '__main__':
+    main()
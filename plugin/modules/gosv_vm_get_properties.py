@@ -0,0 +1,167 @@
+#!/usr/bin/python
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+""" Ansible vSphere GOS Validation VM Properties Module """
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+    module: gosv_vm_get_properties
+    short_description: Get VM properties of dotted property paths only
+    description:
+      - This module retrieves only the specified VM property paths with property
+        collector, e.g. 'config.hardware.device' or 'guest.net', instead of getting
+        whole top level properties like 'config' and filtering them at client side.
+      - The property values are returned in a dict nested by property path, in the same
+        JSON format of community.vmware.vmware_guest_info with schema 'vsphere'.
+    options:
+      hostname:
+        description: The vCenter Server or ESXi host name or IP address.
+        required: true
+      username:
+        description: The username of vCenter Server or ESXi host.
+        required: true
+      password:
+        description: The password of vCenter Server or ESXi host.
+        required: true
+      port:
+        description:
+          - The port of vCenter Server or ESXi host.
+          - If not set, the value of environment variable VMWARE_PORT will be used.
+        default: 443
+      validate_certs:
+        description: Whether to validate server certificate.
+        default: false
+      name:
+        description: The VM name.
+        required: true
+      folder:
+        description:
+          - The VM folder path, e.g. '/DC0/vm' or '/DC0/vm/sub_folder'.
+          - If not set, VM is searched by name in whole inventory.
+      properties:
+        description: The VM property paths to get, e.g. 'config.hardware.device'.
+        default: ['config']
+'''
+
+EXAMPLES = '''
+- name: "Get VM devices and guest networks"
+  gosv_vm_get_properties:
+    hostname: "{{ vsphere_host_name }}"
+    username: "{{ vsphere_host_user }}"
+    password: "{{ vsphere_host_user_password }}"
+    folder: "{{ vm_folder }}"
+    name: "{{ vm_name }}"
+    properties:
+      - config.hardware.device
+      - guest.net
+'''
+
+RETURN = '''
+    instance:
+      description:
+        - The dict of VM property values nested by property path, e.g.
+          {'config': {'hardware': {'device': [...]}}, 'guest': {'net': [...]}}.
+        - The value of a property path which is not set is null.
+    payload_size:
+      description: The size in bytes of returned property values in JSON.
+    elapsed:
+      description: The seconds taken to get VM properties.
+'''
+
+import json
+import time
+
+try:
+    from pyVmomi import vim, vmodl
+    from pyVmomi.VmomiJSONEncoder import VmomiJSONEncoder
+    HAS_PYVMOMI = True
+except ImportError:
+    HAS_PYVMOMI = False
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.gosv_vsphere import vsphere_argument_spec, connect_vsphere, disconnect_vsphere, get_vm
+
+
+def set_path_value(result, path, value):
+    """
+    Set value of a dotted property path in a nested dict. The value of a sub path
+    is not set when its parent path is retrieved with value null.
+    """
+    keys = path.split('.')
+    for key in keys[:-1]:
+        if key not in result:
+            result[key] = {}
+        elif not isinstance(result[key], dict):
+            return
+        result = result[key]
+    result[keys[-1]] = value
+
+
+def get_vm_properties(si, vm, paths):
+    """
+    Retrieve VM property paths with property collector
+    :return: the dict of property paths and their values in JSON format
+    """
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=vm, skip=False)],
+        propSet=[vmodl.query.PropertyCollector.PropertySpec(type=vim.VirtualMachine,
+                                                            all=False,
+                                                            pathSet=paths)])
+    result = si.content.propertyCollector.RetrievePropertiesEx(
+        [filter_spec], vmodl.query.PropertyCollector.RetrieveOptions())
+
+    values = dict((path, None) for path in paths)
+    for obj in result.objects if result else []:
+        for prop in obj.propSet or []:
+            values[prop.name] = prop.val
+    return json.loads(json.dumps(values, cls=VmomiJSONEncoder, sort_keys=True, strip_dynamic=True))
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=vsphere_argument_spec(
+            name=dict(type='str', required=True),
+            folder=dict(type='str'),
+            properties=dict(type='list', elements='str', default=['config']),
+        ),
+        supports_check_mode=True,
+    )
+
+    if not HAS_PYVMOMI:
+        module.fail_json(msg=missing_required_lib('pyvmomi'))
+
+    paths = []
+    for path in module.params['properties']:
+        if path and path not in paths:
+            paths.append(path)
+    if not paths:
+        module.fail_json(msg="At least one VM property path is required")
+
+    start_time = time.time()
+    si = connect_vsphere(module)
+
+    try:
+        vm = get_vm(module, si)
+
+        values = get_vm_properties(si, vm, paths)
+        # Set shorter paths first, so that their values do not replace values of sub paths
+        instance = {}
+        for path in sorted(values, key=lambda path: path.count('.')):
+            set_path_value(instance, path, values[path])
+
+        module.exit_json(changed=False,
+                         instance=instance,
+                         payload_size=len(json.dumps(instance, separators=(',', ':'))),
+                         elapsed=round(time.time() - start_time, 3))
+    except vmodl.query.InvalidProperty as e:
+        module.fail_json(msg="Invalid VM property path in %s: %s" % (paths, to_native(e.name)))
+    except vmodl.MethodFault as e:
+        module.fail_json(msg=to_native(e.msg))
+    finally:
+        disconnect_vsphere(si)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/python
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+""" Ansible vSphere GOS Validation VM Property Wait Module """
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+    module: gosv_vm_wait_property
+    short_description: Wait for VM properties to be expected values with property collector updates
+    description:
+      - This module creates a property filter on specified VM properties, and waits for
+        property changes with WaitForUpdatesEx until all properties are expected values
+        or timeout, instead of getting all VM properties repeatedly.
+    options:
+      hostname:
+        description: The vCenter Server or ESXi host name or IP address.
+        required: true
+      username:
+        description: The username of vCenter Server or ESXi host.
+        required: true
+      password:
+        description: The password of vCenter Server or ESXi host.
+        required: true
+      port:
+        description:
+          - The port of vCenter Server or ESXi host.
+          - If not set, the value of environment variable VMWARE_PORT will be used.
+        default: 443
+      validate_certs:
+        description: Whether to validate server certificate.
+        default: false
+      name:
+        description: The VM name.
+        required: true
+      folder:
+        description:
+          - The VM folder path, e.g. '/DC0/vm' or '/DC0/vm/sub_folder'.
+          - If not set, VM is searched by name in whole inventory.
+      expected:
+        description: The dict of VM property paths and their expected values.
+        default: {}
+      match:
+        description:
+          - The dict of VM property paths and regular expressions, which their
+            values are expected to match.
+        default: {}
+      properties:
+        description: Other VM property paths to return their values, which are not waited.
+        default: []
+      timeout:
+        description: The seconds to wait for VM properties to be expected values.
+        default: 300
+'''
+
+EXAMPLES = '''
+- name: "Wait for VM power state to be poweredOn"
+  gosv_vm_wait_property:
+    hostname: "{{ vsphere_host_name }}"
+    username: "{{ vsphere_host_user }}"
+    password: "{{ vsphere_host_user_password }}"
+    folder: "{{ vm_folder }}"
+    name: "{{ vm_name }}"
+    expected:
+      runtime.powerState: poweredOn
+    timeout: 120
+'''
+
+RETURN = '''
+    properties:
+      description: The dict of VM property paths and their last values.
+    updates:
+      description: The number of property updates received.
+    elapsed:
+      description: The seconds waited for VM properties to be expected values.
+'''
+
+import re
+import time
+
+try:
+    from pyVmomi import vim, vmodl
+    HAS_PYVMOMI = True
+except ImportError:
+    HAS_PYVMOMI = False
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.gosv_vsphere import vsphere_argument_spec, connect_vsphere, disconnect_vsphere, get_vm
+
+# The maximum seconds of one WaitForUpdatesEx call, so that the deadline is checked
+# even when there is no property change
+MAX_WAIT_SECONDS = 60
+
+
+def to_value(value):
+    """
+    Convert property value to a value which can be returned in module result
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [to_value(item) for item in value]
+    return str(value)
+
+
+def apply_property_changes(values, update):
+    """
+    Update property values with the changes in an UpdateSet of WaitForUpdatesEx
+    """
+    for filter_update in update.filterSet or []:
+        for object_update in filter_update.objectSet or []:
+            for change in object_update.changeSet or []:
+                values[change.name] = None if change.op == 'remove' else to_value(change.val)
+
+
+def properties_met(values, expected, match):
+    for path, value in expected.items():
+        if to_native(values.get(path)) != to_native(value):
+            return False
+    for path, regexp in match.items():
+        if values.get(path) in [None, ''] or not re.search(regexp, to_native(values.get(path))):
+            return False
+    return True
+
+
+def wait_vm_properties(si, vm, paths, expected, match, timeout):
+    """
+    Wait for VM properties to be expected values with a dedicated property collector
+    :return: the property values, the number of updates, and whether they are expected
+    """
+    deadline = time.time() + timeout
+    collector = si.content.propertyCollector.CreatePropertyCollector()
+    try:
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=vm, skip=False)],
+            propSet=[vmodl.query.PropertyCollector.PropertySpec(type=vim.VirtualMachine,
+                                                                all=False,
+                                                                pathSet=paths)])
+        collector.CreateFilter(filter_spec, partialUpdates=True)
+
+        values = dict((path, None) for path in paths)
+        updates = 0
+        version = ''
+        while True:
+            remaining = int(deadline - time.time())
+            if remaining <= 0:
+                return values, updates, False
+            options = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=min(remaining, MAX_WAIT_SECONDS))
+            update = collector.WaitForUpdatesEx(version, options)
+            if update is None:
+                continue
+            updates += 1
+            version = update.version
+            apply_property_changes(values, update)
+            if properties_met(values, expected, match):
+                return values, updates, True
+    finally:
+        collector.Destroy()
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=vsphere_argument_spec(
+            name=dict(type='str', required=True),
+            folder=dict(type='str'),
+            expected=dict(type='dict', default={}),
+            match=dict(type='dict', default={}),
+            properties=dict(type='list', elements='str', default=[]),
+            timeout=dict(type='int', default=300),
+        ),
+        supports_check_mode=True,
+    )
+
+    if not HAS_PYVMOMI:
+        module.fail_json(msg=missing_required_lib('pyvmomi'))
+
+    expected = module.params['expected']
+    match = module.params['match']
+    if not expected and not match:
+        module.fail_json(msg="At least one of 'expected' and 'match' is required")
+    paths = list(expected) + [path for path in match if path not in expected]
+    paths += [path for path in module.params['properties'] if path not in paths]
+
+    start_time = time.time()
+    si = connect_vsphere(module)
+
+    try:
+        vm = get_vm(module, si)
+
+        values, updates, success = wait_vm_properties(si, vm, paths, expected, match,
+                                                      module.params['timeout'])
+        result = dict(changed=False,
+                      properties=values,
+                      updates=updates,
+                      elapsed=round(time.time() - start_time, 1))
+        if not success:
+            module.fail_json(msg="Timed out waiting for VM properties to be expected in %d seconds" %
+                             module.params['timeout'], **result)
+        module.exit_json(**result)
+    except vmodl.MethodFault as e:
+        module.fail_json(msg=to_native(e.msg))
+    finally:
+        disconnect_vsphere(si)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script downloads files from ESXi datastore through the datastore file HTTP
+# API '/folder/<path>?dcPath=<datacenter>&dsName=<datastore>'.
+# Each file is downloaded with one GET request, which also tells whether the file
+# exists, instead of checking file existence before downloading it. The folder URL
+# of each VM directory is built once, and all files are downloaded in one connection.
+# When a validators cache file is given, the ETag and Last-Modified of downloaded
+# files are saved in it. If a file was downloaded to the same local path before, the
+# GET request is conditional, and the local file is kept when server returns 304.
+# The datastore username and password are read from environment variables
+# DATASTORE_DOWNLOAD_USERNAME and DATASTORE_DOWNLOAD_PASSWORD.
+# The result is printed in JSON with keys:
+#   files: the list of download results of files, with keys 'src', 'dest', 'url',
+#     'size', 'status_code' of HTTP GET request and 'status', which is 'downloaded',
+#     'not_modified', 'not_found' or 'failed'
+#   size: the total bytes downloaded
+#   elapsed: the seconds of downloading all files
+#   requests: the number of HTTP requests sent
+#
+# Example:
+#   python3 datastore_download.py -H esxi.example.com -d datastore1 \
+#     -f vm/vm.vmx=/tmp/vm.vmx -f vm/vmware.log=/tmp/vmware.log -v /tmp/validators.json
+#
+import os
+import ssl
+import sys
+import json
+import time
+import base64
+import socket
+import posixpath
+import traceback
+from argparse import ArgumentParser
+from http.client import HTTPSConnection, HTTPException
+from urllib.parse import quote, urlencode
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def parse_arguments():
+    parser = ArgumentParser(description="Download files from ESXi datastore")
+    parser.add_argument("-H", dest="host", required=True,
+                        help="the ESXi host name or IP address, with optional port")
+    parser.add_argument("-d", dest="datastore", required=True,
+                        help="the datastore name")
+    parser.add_argument("-c", dest="datacenter", default="ha-datacenter",
+                        help="the datacenter name. Default is ha-datacenter")
+    parser.add_argument("-f", dest="files", action="append", required=True,
+                        help="the file path in datastore and its local path in format '<src>=<dest>'")
+    parser.add_argument("-v", dest="validators_file",
+                        help="the JSON file to cache ETag and Last-Modified of downloaded files")
+    parser.add_argument("-t", dest="timeout", type=int, default=300,
+                        help="the socket timeout in seconds. Default is 300")
+    parser.add_argument("-k", dest="validate_certs", action="store_true", default=False,
+                        help="validate server certificate")
+    return parser.parse_args()
+
+class DatastoreDownloader(object):
+    def __init__(self, host, datastore, datacenter='ha-datacenter', username=None, password=None,
+                 validators=None, timeout=300, validate_certs=False):
+        self.host = host
+        self.datastore = datastore
+        self.datacenter = datacenter
+        self.query = urlencode({'dcPath': datacenter, 'dsName': datastore})
+        self.validators = validators if validators is not None else {}
+        self.timeout = timeout
+        self.headers = {}
+        if username:
+            credential = ('%s:%s' % (username, password or '')).encode('utf-8')
+            self.headers['Authorization'] = 'Basic ' + base64.b64encode(credential).decode('ascii')
+        self.ssl_context = ssl.create_default_context()
+        if not validate_certs:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        self.folder_urls = {}
+        self.requests = 0
+        self._conn = None
+
+    def _folder_url(self, folder):
+        if folder not in self.folder_urls:
+            self.folder_urls[folder] = '/folder/%s' % quote(folder.strip('/'))
+        return self.folder_urls[folder]
+
+    def _url(self, src):
+        folder, name = posixpath.split(src.strip('/'))
+        return '%s/%s?%s' % (self._folder_url(folder), quote(name), self.query)
+
+    def _get(self, url, headers):
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = HTTPSConnection(self.host, timeout=self.timeout, context=self.ssl_context)
+            try:
+                self.requests += 1
+                self._conn.request('GET', url, headers=headers)
+                return self._conn.getresponse()
+            except (HTTPException, ConnectionError, socket.timeout):
+                # Server might close the idle connection, retry in a new connection once
+                self.close()
+                if attempt > 0:
+                    raise
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def download(self, src, dest):
+        # Datastores on different hosts or datacenters could have the same name
+        key = '%s/%s/[%s] %s' % (self.host, self.datacenter, self.datastore, src.strip('/'))
+        url = self._url(src)
+        headers = dict(self.headers)
+        cached = self.validators.get(key, {})
+        if (cached.get('dest') == dest and os.path.isfile(dest) and
+                os.path.getsize(dest) == cached.get('size')):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        result = {'src': src, 'dest': dest, 'url': 'https://%s%s' % (self.host, url), 'size': 0}
+        response = self._get(url, headers)
+        result['status_code'] = response.status
+        if response.status == 200:
+            tmp_dest = dest + '.part'
+            try:
+                with open(tmp_dest, 'wb') as f:
+                    while True:
+                        data = response.read(COPY_BUFFER_SIZE)
+                        if not data:
+                            break
+                        f.write(data)
+                        result['size'] += len(data)
+            except Exception:
+                self.close()
+                if os.path.exists(tmp_dest):
+                    os.remove(tmp_dest)
+                raise
+            os.replace(tmp_dest, dest)
+            result['status'] = 'downloaded'
+            # The local file is not the one downloaded for other keys any more
+            for other_key in [k for k, v in self.validators.items() if v.get('dest') == dest]:
+                self.validators.pop(other_key)
+            self.validators[key] = {'dest': dest,
+                                    'size': result['size'],
+                                    'etag': response.headers.get('ETag', ''),
+                                    'last_modified': response.headers.get('Last-Modified', '')}
+        else:
+            response.read()
+            if response.status == 304:
+                result['status'] = 'not_modified'
+                result['size'] = os.path.getsize(dest)
+            elif response.status == 404:
+                result['status'] = 'not_found'
+                self.validators.pop(key, None)
+            else:
+                result['status'] = 'failed'
+                result['msg'] = 'HTTP %d %s' % (response.status, response.reason)
+        return result
+
+    def download_files(self, files):
+        start_time = time.time()
+        try:
+            results = [self.download(src, dest) for src, dest in files]
+        finally:
+            self.close()
+        return {'files': results,
+                'size': sum(result['size'] for result in results if result['status'] == 'downloaded'),
+                'elapsed': round(time.time() - start_time, 3),
+                'requests': self.requests}
+
+def load_validators(validators_file):
+    if validators_file and os.path.isfile(validators_file):
+        try:
+            with open(validators_file) as f:
+                return json.load(f)
+        except ValueError:
+            pass
+    return {}
+
+def save_validators(validators_file, validators):
+    tmp_file = '%s.%d' % (validators_file, os.getpid())
+    with open(tmp_file, 'w') as f:
+        json.dump(validators, f, indent=4, sort_keys=True)
+    os.replace(tmp_file, validators_file)
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        files = []
+        for file_arg in args.files:
+            if '=' not in file_arg:
+                raise Exception("Invalid file argument '%s', it must be in format '<src>=<dest>'" % file_arg)
+            files.append(tuple(file_arg.split('=', 1)))
+        validators = load_validators(args.validators_file)
+        downloader = DatastoreDownloader(args.host, args.datastore, args.datacenter,
+                                         username=os.environ.get('DATASTORE_DOWNLOAD_USERNAME'),
+                                         password=os.environ.get('DATASTORE_DOWNLOAD_PASSWORD'),
+                                         validators=validators,
+                                         timeout=args.timeout,
+                                         validate_certs=args.validate_certs)
+        result = downloader.download_files(files)
+        if args.validators_file:
+            save_validators(args.validators_file, downloader.validators)
+        print(json.dumps(result))
+    except Exception:
+        sys.stderr.write(traceback.format_exc())
+        sys.exit(1)
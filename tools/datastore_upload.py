@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script uploads local files to ESXi datastore through the datastore file HTTP
+# API '/folder/<path>?dcPath=<datacenter>&dsName=<datastore>'.
+# Each file is streamed from disk with a bounded buffer in one HTTP PUT request,
+# and the socket send buffer is enlarged to the same size to keep a high-latency
+# link busy. The datastore file API doesn't support writing a file in ranges, so
+# multiple files are uploaded concurrently, while one file is uploaded in one stream.
+# After upload, the size of each file in datastore is verified with a HEAD request.
+# The datastore username and password are read from environment variables
+# DATASTORE_UPLOAD_USERNAME and DATASTORE_UPLOAD_PASSWORD.
+# The result is printed in JSON with keys:
+#   files: the list of upload results of files, with keys 'src', 'dest', 'size',
+#     'elapsed', 'throughput_mbps' and 'status' of HTTP PUT request
+#   size: the total bytes uploaded
+#   elapsed: the seconds of uploading all files
+#   throughput_mbps: the total throughput in MB/s
+#
+# Example:
+#   python3 datastore_upload.py -H esxi.example.com -d datastore1 \
+#     -f /tmp/os.iso=iso/os.iso -f /tmp/unattend.iso=iso/unattend.iso -j 2
+#
+import os
+import ssl
+import sys
+import json
+import time
+import base64
+import socket
+import traceback
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPSConnection
+from urllib.parse import quote, urlencode
+
+def parse_arguments():
+    parser = ArgumentParser(description="Upload local files to ESXi datastore")
+    parser.add_argument("-H", dest="host", required=True,
+                        help="the ESXi host name or IP address, with optional port")
+    parser.add_argument("-d", dest="datastore", required=True,
+                        help="the datastore name")
+    parser.add_argument("-c", dest="datacenter", default="ha-datacenter",
+                        help="the datacenter name. Default is ha-datacenter")
+    parser.add_argument("-f", dest="files", action="append", required=True,
+                        help="the local file path and its path in datastore in format '<src>=<dest>'")
+    parser.add_argument("-j", dest="concurrency", type=int, default=4,
+                        help="the maximum number of files uploaded concurrently. Default is 4")
+    parser.add_argument("-b", dest="buffer_mb", type=float, default=4,
+                        help="the buffer size in MB to read file and send data. Default is 4")
+    parser.add_argument("-t", dest="timeout", type=int, default=300,
+                        help="the socket timeout in seconds. Default is 300")
+    parser.add_argument("-k", dest="validate_certs", action="store_true", default=False,
+                        help="validate server certificate")
+    return parser.parse_args()
+
+class DatastoreUploader(object):
+    def __init__(self, host, datastore, datacenter='ha-datacenter', username=None, password=None,
+                 buffer_size=4 * 1024 * 1024, timeout=300, validate_certs=False):
+        self.host = host
+        self.query = urlencode({'dcPath': datacenter, 'dsName': datastore})
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.headers = {}
+        if username:
+            credential = ('%s:%s' % (username, password or '')).encode('utf-8')
+            self.headers['Authorization'] = 'Basic ' + base64.b64encode(credential).decode('ascii')
+        self.ssl_context = ssl.create_default_context()
+        if not validate_certs:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+    def _connect(self):
+        conn = HTTPSConnection(self.host, timeout=self.timeout, context=self.ssl_context,
+                               blocksize=self.buffer_size)
+        conn.connect()
+        conn.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
+        return conn
+
+    def _url(self, dest):
+        return '/folder/%s?%s' % (quote(dest.strip('/')), self.query)
+
+    def _request(self, conn, method, dest, body=None, headers=None):
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        conn.request(method, self._url(dest), body=body, headers=request_headers)
+        response = conn.getresponse()
+        response.read()
+        return response
+
+    def upload(self, src, dest):
+        size = os.path.getsize(src)
+        start_time = time.time()
+        conn = self._connect()
+        try:
+            # Check authorization before sending file content, because server closes
+            # the connection without reading the file content when it rejects a PUT
+            response = self._request(conn, 'HEAD', dest)
+            if response.status in (401, 403):
+                raise Exception("Failed to upload '%s' to '%s': HTTP %d %s" %
+                                (src, dest, response.status, response.reason))
+            try:
+                with open(src, 'rb', buffering=self.buffer_size) as src_file:
+                    response = self._request(conn, 'PUT', dest, body=src_file,
+                                             headers={'Content-Type': 'application/octet-stream',
+                                                      'Content-Length': str(size)})
+            except (ssl.SSLError, ConnectionError) as e:
+                raise Exception("Connection is closed by server when uploading '%s' to '%s', "
+                                "please check the datastore path exists: %s" % (src, dest, e))
+            if response.status not in (200, 201):
+                raise Exception("Failed to upload '%s' to '%s': HTTP %d %s" %
+                                (src, dest, response.status, response.reason))
+            elapsed = time.time() - start_time
+            put_status = response.status
+
+            response = self._request(conn, 'HEAD', dest)
+            uploaded_size = int(response.headers.get('Content-Length', -1))
+            if response.status != 200 or uploaded_size != size:
+                raise Exception("The size of uploaded file '%s' is %d, not the expected %d" %
+                                (dest, uploaded_size, size))
+        finally:
+            conn.close()
+
+        return {'src': src,
+                'dest': dest,
+                'size': size,
+                'elapsed': round(elapsed, 3),
+                'throughput_mbps': round(size / 1048576 / max(elapsed, 0.001), 2),
+                'status': put_status}
+
+    def upload_files(self, files, concurrency):
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(files)))) as executor:
+            results = list(executor.map(lambda f: self.upload(*f), files))
+        elapsed = time.time() - start_time
+        size = sum(result['size'] for result in results)
+        return {'files': results,
+                'size': size,
+                'elapsed': round(elapsed, 3),
+                'throughput_mbps': round(size / 1048576 / max(elapsed, 0.001), 2)}
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        files = []
+        for file_arg in args.files:
+            if '=' not in file_arg:
+                raise Exception("Invalid file argument '%s', it must be in format '<src>=<dest>'" % file_arg)
+            files.append(tuple(file_arg.split('=', 1)))
+        uploader = DatastoreUploader(args.host, args.datastore, args.datacenter,
+                                     username=os.environ.get('DATASTORE_UPLOAD_USERNAME'),
+                                     password=os.environ.get('DATASTORE_UPLOAD_PASSWORD'),
+                                     buffer_size=int(args.buffer_mb * 1024 * 1024),
+                                     timeout=args.timeout,
+                                     validate_certs=args.validate_certs)
+        print(json.dumps(uploader.upload_files(files, args.concurrency)))
+    except Exception:
+        sys.stderr.write(traceback.format_exc())
+        sys.exit(1)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script is a stand-in DHCP server for linux/utils/scripts/dhcp_release.py.
+# It can capture and decode DHCP packets on a loopback address or in a network
+# namespace, check DHCP server discovery against synthetic lease files of single
+# and multiple interfaces, and benchmark the discovery fallbacks on a plain Linux box.
+#
+# Examples:
+#   Capture packets in a network namespace:
+#     ip netns exec dhcptest python3 dhcp_server_stub.py serve -a 0.0.0.0 -p 67
+#   Check discovery and release path on loopback:
+#     python3 dhcp_server_stub.py check
+#   Benchmark discovery fallbacks:
+#     python3 dhcp_server_stub.py benchmark -n 200
+#
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import struct
+import tempfile
+import threading
+import traceback
+from argparse import ArgumentParser, RawTextHelpFormatter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+                                'linux', 'utils', 'scripts'))
+import dhcp_release
+
+DHCP_MESSAGE_TYPES = {1: 'DHCPDISCOVER', 2: 'DHCPOFFER', 3: 'DHCPREQUEST', 4: 'DHCPDECLINE',
+                      5: 'DHCPACK', 6: 'DHCPNAK', 7: 'DHCPRELEASE', 8: 'DHCPINFORM'}
+BOOTP_HEADER = struct.Struct('!BBBBIHH4s4s4s4s16s64s128s4s')
+MAGIC_COOKIE = b'\x63\x82\x53\x63'
+
+# Synthetic lease file contents for each lease format supported by dhcp_release.py,
+# with an older lease before the newest one which is expected to be found
+LEASE_FORMATS = {
+    'dhclient': ('/var/lib/dhcp/dhclient.{ifname}.leases',
+                 'lease {{\n  interface "{ifname}";\n  fixed-address 192.168.100.10;\n'
+                 '  option dhcp-server-identifier {old_server};\n}}\n'
+                 'lease {{\n  interface "{ifname}";\n  fixed-address 192.168.100.10;\n'
+                 '  option dhcp-server-identifier {server};\n  renew 4 2026/01/01 00:00:00;\n}}\n'),
+    'dhclient_rhel': ('/var/lib/dhclient/dhclient-{ifname}.leases',
+                      'lease {{\n  interface "{ifname}";\n  option dhcp-server-identifier {old_server};\n}}\n'
+                      'lease {{\n  interface "{ifname}";\n  option dhcp-server-identifier {server};\n}}\n'),
+    'networkmanager_dhclient': ('/var/lib/NetworkManager/dhclient-0123-{ifname}.lease',
+                                'lease {{\n  interface "{ifname}";\n  option dhcp-server-identifier {server};\n}}\n'),
+    'networkmanager_internal': ('/var/lib/NetworkManager/internal-0123-{ifname}.lease',
+                                '# This is private data. Do not parse.\n'
+                                'ADDRESS=192.168.100.10\nSERVER_ADDRESS={server}\n'),
+    'freebsd': ('/var/db/dhclient.leases.{ifname}',
+                'lease {{\n  interface "{ifname}";\n  option dhcp-server-identifier {old_server};\n}}\n'
+                'lease {{\n  interface "{ifname}";\n  option dhcp-server-identifier {server};\n}}\n'),
+    'networkd': (os.path.join(dhcp_release.NETWORKD_LEASE_DIR, '{ifindex}'),
+                 '# This is private data. Do not parse.\n'
+                 'ADDRESS=192.168.100.10\nSERVER_ADDRESS={server}\n'),
+}
+
+# Synthetic lease files shared by or named after multiple interfaces, and the DHCP
+# server expected to be found for each interface. The newest leases and lease files
+# are of other interfaces, and 'eth3' with static IP address has no lease.
+MULTI_NIC_LEASE_FILES = [
+    ('/var/lib/dhcp/dhclient.leases',
+     'lease {\n  interface "lo";\n  option dhcp-server-identifier 192.168.101.1;\n}\n'
+     'lease {\n  interface "eth1";\n  option dhcp-server-identifier 192.168.102.1;\n}\n'),
+    ('/var/lib/NetworkManager/internal-0123-eth2.lease',
+     '# This is private data. Do not parse.\nADDRESS=192.168.103.10\nSERVER_ADDRESS=192.168.103.1\n'),
+    ('/var/lib/NetworkManager/dhclient-0456-eth20.lease',
+     'lease {\n  interface "eth20";\n  option dhcp-server-identifier 192.168.104.1;\n}\n'),
+]
+MULTI_NIC_SERVERS = {'lo': '192.168.101.1',
+                     'eth1': '192.168.102.1',
+                     'eth2': '192.168.103.1',
+                     'eth20': '192.168.104.1',
+                     'eth3': None}
+
+def parse_arguments():
+    parser = ArgumentParser(description="A stand-in DHCP server and test harness for dhcp_release.py",
+                            formatter_class=RawTextHelpFormatter)
+    subparsers = parser.add_subparsers(dest="action")
+    subparsers.required = True
+
+    serve_parser = subparsers.add_parser("serve", help="capture and decode DHCP packets")
+    serve_parser.add_argument("-a", dest="address", default="127.0.0.1",
+                              help="the address to listen on. Default is 127.0.0.1")
+    serve_parser.add_argument("-p", dest="port", type=int, default=dhcp_release.DHCP_SERVER_PORT,
+                              help="the UDP port to listen on. Default is %d" % dhcp_release.DHCP_SERVER_PORT)
+    serve_parser.add_argument("-c", dest="count", type=int, default=0,
+                              help="exit after capturing the number of packets. Default is 0, never exit")
+
+    subparsers.add_parser("check", help="check DHCP server discovery and DHCPRELEASE packets")
+
+    bench_parser = subparsers.add_parser("benchmark", help="benchmark DHCP server discovery fallbacks")
+    bench_parser.add_argument("-n", dest="iterations", type=int, default=100,
+                              help="the number of iterations for each discovery method. Default is 100")
+    bench_parser.add_argument("-l", dest="leases", type=int, default=20000,
+                              help="the number of leases in the synthetic lease file. Default is 20000")
+
+    return parser.parse_args()
+
+def decode_dhcp_packet(packet):
+    """
+    Decode a BOOTP/DHCP packet into a dict
+    """
+    if len(packet) < BOOTP_HEADER.size:
+        raise ValueError("Packet is too short: %d bytes" % len(packet))
+
+    (op, htype, hlen, hops, xid, secs, flags, ciaddr, yiaddr, siaddr, giaddr,
+     chaddr, sname, file_name, cookie) = BOOTP_HEADER.unpack_from(packet, 0)
+    if cookie != MAGIC_COOKIE:
+        raise ValueError("Invalid DHCP magic cookie: %r" % cookie)
+
+    options = {}
+    offset = BOOTP_HEADER.size
+    while offset < len(packet):
+        code = packet[offset]
+        if code == 255:
+            break
+        if code == 0:
+            offset += 1
+            continue
+        length = packet[offset + 1]
+        options[code] = packet[offset + 2:offset + 2 + length]
+        offset += 2 + length
+
+    decoded = {'op': op,
+               'xid': xid,
+               'ciaddr': socket.inet_ntoa(ciaddr),
+               'yiaddr': socket.inet_ntoa(yiaddr),
+               'siaddr': socket.inet_ntoa(siaddr),
+               'giaddr': socket.inet_ntoa(giaddr),
+               'chaddr': ':'.join('%02x' % b for b in chaddr[:hlen]),
+               'length': len(packet),
+               'message_type': None,
+               'server_identifier': None}
+    if 53 in options:
+        decoded['message_type'] = DHCP_MESSAGE_TYPES.get(options[53][0], options[53][0])
+    if 54 in options:
+        decoded['server_identifier'] = socket.inet_ntoa(options[54][:4])
+    return decoded
+
+class DhcpServerStub(object):
+    """
+    A UDP listener which captures and decodes DHCP packets
+    """
+    def __init__(self, address='127.0.0.1', port=0):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((address, port))
+        self.address, self.port = self.sock.getsockname()
+        self.packets = []
+
+    def capture(self, count=0, timeout=None):
+        self.sock.settimeout(timeout)
+        while count == 0 or len(self.packets) < count:
+            try:
+                data, peer = self.sock.recvfrom(4096)
+            except socket.timeout:
+                break
+            try:
+                decoded = decode_dhcp_packet(data)
+            except ValueError as e:
+                decoded = {'error': str(e)}
+            decoded['peer'] = '%s:%d' % peer
+            self.packets.append(decoded)
+            yield decoded
+
+    def close(self):
+        self.sock.close()
+
+def serve(address, port, count):
+    stub = DhcpServerStub(address, port)
+    print("Listening on %s:%d" % (stub.address, stub.port))
+    sys.stdout.flush()
+    try:
+        for decoded in stub.capture(count):
+            print(json.dumps(decoded))
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.close()
+
+def write_lease_files(root_dir, lease_format, ifname, server, old_server='192.168.100.254'):
+    """
+    Write synthetic lease file of one format under root_dir and return lease patterns
+    relocated under root_dir
+    """
+    path_format, content_format = LEASE_FORMATS[lease_format]
+    lease_file = root_dir + path_format.format(ifname=ifname,
+                                               ifindex=dhcp_release.get_interface_index(ifname))
+    if not os.path.exists(os.path.dirname(lease_file)):
+        os.makedirs(os.path.dirname(lease_file))
+    with open(lease_file, 'w') as f:
+        f.write(content_format.format(ifname=ifname, server=server, old_server=old_server))
+
+    return [root_dir + pattern for pattern in dhcp_release.get_lease_patterns(ifname)]
+
+def check():
+    """
+    Check DHCP server discovery for each lease format, and DHCPRELEASE packets
+    received by the stand-in DHCP server
+    """
+    failures = []
+    ifname = 'lo'
+    networkd_lease_dir = dhcp_release.NETWORKD_LEASE_DIR
+    for lease_format in sorted(LEASE_FORMATS):
+        server = '192.168.100.%d' % (sorted(LEASE_FORMATS).index(lease_format) + 1)
+        root_dir = tempfile.mkdtemp(prefix='dhcp_release_')
+        try:
+            dhcp_release.NETWORKD_LEASE_DIR = root_dir + networkd_lease_dir
+            lease_patterns = write_lease_files(root_dir, lease_format, ifname, server)
+            found = dhcp_release.get_lease_server(ifname, lease_patterns)
+        finally:
+            dhcp_release.NETWORKD_LEASE_DIR = networkd_lease_dir
+            shutil.rmtree(root_dir)
+        status = 'PASS' if found == server else 'FAIL'
+        if status == 'FAIL':
+            failures.append(lease_format)
+        print("%s: get_lease_server with %s lease: expected %s, got %s" % (status, lease_format, server, found))
+
+    root_dir = tempfile.mkdtemp(prefix='dhcp_release_')
+    try:
+        dhcp_release.NETWORKD_LEASE_DIR = root_dir + networkd_lease_dir
+        for lease_file, content in MULTI_NIC_LEASE_FILES:
+            if not os.path.exists(os.path.dirname(root_dir + lease_file)):
+                os.makedirs(os.path.dirname(root_dir + lease_file))
+            with open(root_dir + lease_file, 'w') as f:
+                f.write(content)
+            # Make the lease file written later newer
+            time.sleep(0.01)
+        for nic in sorted(MULTI_NIC_SERVERS):
+            lease_patterns = [root_dir + pattern for pattern in dhcp_release.get_lease_patterns(nic)]
+            found = dhcp_release.get_lease_server(nic, lease_patterns)
+            status = 'PASS' if found == MULTI_NIC_SERVERS[nic] else 'FAIL'
+            if status == 'FAIL':
+                failures.append('multi_nic_' + nic)
+            print("%s: get_lease_server for %s with multiple NICs lease: expected %s, got %s" %
+                  (status, nic, MULTI_NIC_SERVERS[nic], found))
+    finally:
+        dhcp_release.NETWORKD_LEASE_DIR = networkd_lease_dir
+        shutil.rmtree(root_dir)
+
+    stub = DhcpServerStub('127.0.0.1', 0)
+    try:
+        releases = [{'interface': ifname, 'client_ip': '192.168.100.%d' % i,
+                     'server_ip': stub.address, 'mac': '00:50:56:00:00:%02x' % i}
+                    for i in range(1, 4)]
+        dhcp_release.send_release_packets(releases, server_port=stub.port)
+        packets = list(stub.capture(len(releases), timeout=5))
+    finally:
+        stub.close()
+
+    for release in releases:
+        matched = [p for p in packets if p.get('ciaddr') == release['client_ip']]
+        if (release['status'] == 'released' and len(matched) == 1 and
+                matched[0]['message_type'] == 'DHCPRELEASE' and
+                matched[0]['chaddr'] == release['mac'] and
+                matched[0]['server_identifier'] == release['server_ip'] and
+                matched[0]['length'] >= 300):
+            print("PASS: DHCPRELEASE for %s received and decoded" % release['client_ip'])
+        else:
+            failures.append(release['client_ip'])
+            print("FAIL: DHCPRELEASE for %s: %s, captured %s" % (release['client_ip'], release, matched))
+
+    return len(failures) == 0
+
+def time_it(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000000 / iterations
+
+def read_lease_file_forward(lease_file):
+    """
+    The full file scan of lease file before reverse block reading, as the baseline
+    """
+    with open(lease_file, 'r') as f:
+        for line in reversed(f.readlines()):
+            line = line.strip()
+            if line.startswith('option dhcp-server-identifier'):
+                return line.split()[2].rstrip(';')
+    return None
+
+def benchmark(iterations, leases):
+    """
+    Print the average time of each DHCP server discovery method
+    """
+    ifname = dhcp_release.get_default_interface() or 'lo'
+    root_dir = tempfile.mkdtemp(prefix='dhcp_release_')
+    lease_file = os.path.join(root_dir, 'dhclient.leases')
+    with open(lease_file, 'w') as f:
+        for i in range(leases):
+            f.write('lease {\n  interface "%s";\n  fixed-address 192.168.100.10;\n'
+                    '  option dhcp-server-identifier 192.168.100.%d;\n'
+                    '  renew 4 2026/01/01 00:00:00;\n}\n' % (ifname, i % 250 + 1))
+
+    methods = [
+        ('rtnetlink default route', lambda: dhcp_release.get_netlink_default_route(ifname)),
+        ('/proc/net/route default route', lambda: dhcp_release.get_proc_default_route(ifname)),
+        ('netstat default route', dhcp_release.get_netstat_default_route),
+        ('rtnetlink interface address', lambda: dhcp_release.get_ip_address(ifname)),
+        ('lease file full scan (%d leases)' % leases, lambda: read_lease_file_forward(lease_file)),
+        ('lease file reverse read (%d leases)' % leases, lambda: dhcp_release.get_lease_file_server(lease_file, ifname)),
+    ]
+    try:
+        print("Interface: %s, iterations: %d" % (ifname, iterations))
+        print("| {:<40} | {:>12} |".format("Discovery method", "Average (us)"))
+        for name, func in methods:
+            try:
+                print("| {:<40} | {:>12.1f} |".format(name, time_it(func, iterations)))
+            except Exception as e:
+                print("| {:<40} | {:>12} |".format(name, type(e).__name__))
+    finally:
+        shutil.rmtree(root_dir)
+
+if __name__ == "__main__":
+    args = parse_arguments()
+
+    try:
+        if args.action == 'serve':
+            serve(args.address, args.port, args.count)
+        elif args.action == 'check':
+            if not check():
+                sys.exit(1)
+        elif args.action == 'benchmark':
+            benchmark(args.iterations, args.leases)
+    except Exception as e:
+        traceback_str = traceback.format_exc()
+        sys.stderr.write(traceback_str)
+        sys.exit(1)
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script starts a local stand-in of vCenter Server and ESXi datastore for
+# measuring the playbooks performance without a lab. It launches vcsim, the
+# vCenter Server simulator in govmomi, and serves a local directory as ESXi
+# datastores through the same '/folder' HTTP API used by community.vmware.vsphere_file,
+# community.vmware.vsphere_copy and datastore file URLs.
+#
+# See tools/fake_vsphere_readme.md for usage.
+#
+import os
+import sys
+import ssl
+import time
+import shutil
+import signal
+import base64
+import threading
+import subprocess
+import traceback
+from email.utils import formatdate, parsedate_to_datetime
+from argparse import ArgumentParser, RawTextHelpFormatter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+
+# Default vcsim inventory: 1 datacenter 'DC0', 1 standalone host 'DC0_H0' with
+# VMs 'DC0_H0_VM0', 'DC0_H0_VM1', and 1 cluster 'DC0_C0' with 3 hosts.
+# The default datastore is 'LocalDS_0'.
+VCSIM_DEFAULT_ARGS = ['-dc', '1', '-cluster', '1', '-host', '1', '-vm', '2']
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def parse_arguments():
+    parser = ArgumentParser(description="A local stand-in of vCenter Server and ESXi datastore",
+                            formatter_class=RawTextHelpFormatter)
+    parser.add_argument("-r", dest="root", default=os.path.join(os.getcwd(), "fake_vsphere"),
+                        help="the local directory of datastores, certificate and logs.\n" +
+                             "Default is ./fake_vsphere")
+    parser.add_argument("-u", dest="username", default="Administrator@vsphere.local",
+                        help="the username of vCenter Server and ESXi. Default is Administrator@vsphere.local")
+    parser.add_argument("-p", dest="password", default="CHANGEME",
+                        help="the password of vCenter Server and ESXi. Default is CHANGEME")
+    parser.add_argument("--vcsim", dest="vcsim", default="vcsim",
+                        help="the vcsim executable path. Default is vcsim in PATH")
+    parser.add_argument("--vcsim-address", dest="vcsim_address", default="127.0.0.1:8989",
+                        help="the address vcsim listens on. Default is 127.0.0.1:8989")
+    parser.add_argument("--vcsim-args", dest="vcsim_args", default=' '.join(VCSIM_DEFAULT_ARGS),
+                        help="the inventory arguments of vcsim. Default is '%s'" % ' '.join(VCSIM_DEFAULT_ARGS))
+    parser.add_argument("--no-vcsim", dest="no_vcsim", action="store_true", default=False,
+                        help="only start the datastore file server")
+    parser.add_argument("--datastore-address", dest="datastore_address", default="127.0.0.1:8443",
+                        help="the address datastore file server listens on. Default is 127.0.0.1:8443")
+    parser.add_argument("--plain-http", dest="plain_http", action="store_true", default=False,
+                        help="serve datastore files over HTTP instead of HTTPS")
+    parser.add_argument("--vm", dest="vms", action="append", default=None,
+                        help="the VM directory to seed with vmware.log and vmx file in datastore.\n" +
+                             "Format is <datastore>/<vm_name>, can be set multiple times.\n" +
+                             "Default is LocalDS_0/DC0_H0_VM0")
+    parser.add_argument("--log-lines", dest="log_lines", type=int, default=20000,
+                        help="the number of lines in seeded vmware.log. Default is 20000")
+    parser.add_argument("--log-append-interval", dest="log_append_interval", type=float, default=0,
+                        help="seconds of interval to append a line to seeded vmware.log files.\n" +
+                             "Default is 0, not to append")
+    return parser.parse_args()
+
+def split_address(address):
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+def log_line(index, message):
+    return "%s| vmx| I005: %s %d\n" % (time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+                                       message, index)
+
+def seed_vm_dirs(root, vms, log_lines):
+    """
+    Create VM directories with a vmware.log and a vmx file in local datastores
+    """
+    log_files = []
+    for vm in vms:
+        datastore, _, vm_name = vm.partition('/')
+        vm_dir = os.path.join(root, 'datastores', datastore, vm_name)
+        if not os.path.exists(vm_dir):
+            os.makedirs(vm_dir)
+
+        with open(os.path.join(vm_dir, vm_name + '.vmx'), 'w') as f:
+            f.write('.encoding = "UTF-8"\nconfig.version = "8"\nvirtualHW.version = "21"\n'
+                    'displayName = "%s"\nguestOS = "otherlinux-64"\n' % vm_name)
+
+        log_file = os.path.join(vm_dir, 'vmware.log')
+        with open(log_file, 'w') as f:
+            for index in range(log_lines):
+                f.write(log_line(index, "Tools: Changing running status"))
+        log_files.append(log_file)
+
+    return log_files
+
+def append_logs(log_files, interval, stop_event):
+    index = 0
+    while not stop_event.wait(interval):
+        index += 1
+        for log_file in log_files:
+            with open(log_file, 'a') as f:
+                f.write(log_line(index, "Guest: fake_vsphere appended message"))
+
+def create_certificate(root):
+    """
+    Create a self-signed certificate for the datastore file server with openssl
+    """
+    cert_file = os.path.join(root, 'fake_vsphere.crt')
+    key_file = os.path.join(root, 'fake_vsphere.key')
+    if not (os.path.exists(cert_file) and os.path.exists(key_file)):
+        subprocess.check_call(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+                               '-subj', '/CN=localhost', '-days', '365',
+                               '-keyout', key_file, '-out', cert_file],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return cert_file, key_file
+
+class DatastoreFileHandler(BaseHTTPRequestHandler):
+    """
+    Serve '/folder/<path>?dsName=<datastore>' requests from local directories
+    with HEAD, GET, PUT and DELETE methods, and support single byte range,
+    ETag and Last-Modified validators in GET requests
+    """
+    protocol_version = 'HTTP/1.1'
+    datastores_dir = None
+    credentials = None
+
+    def log_message(self, format, *args):
+        sys.stderr.write("%s datastore: %s\n" % (time.strftime("%H:%M:%S"), format % args))
+
+    def _send_empty(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _authorized(self):
+        if not self.credentials:
+            return True
+        if self.headers.get('Authorization', '') == self.credentials:
+            return True
+        self._send_empty(401, {'WWW-Authenticate': 'Basic realm="VMware HTTP server"'})
+        return False
+
+    def _get_file_path(self):
+        url = urlsplit(self.path)
+        if not url.path.startswith('/folder'):
+            return None
+        datastore = parse_qs(url.query).get('dsName', [''])[0]
+        file_path = unquote(url.path[len('/folder'):]).strip('/')
+        if not datastore:
+            return None
+        datastore_dir = os.path.realpath(os.path.join(self.datastores_dir, datastore))
+        full_path = os.path.realpath(os.path.join(datastore_dir, file_path))
+        if full_path != datastore_dir and not full_path.startswith(datastore_dir + os.sep):
+            return None
+        return full_path
+
+    def _get_validators(self, file_stat):
+        etag = '"%x-%x"' % (file_stat.st_size, int(file_stat.st_mtime * 1000000))
+        last_modified = formatdate(file_stat.st_mtime, usegmt=True)
+        return etag, last_modified
+
+    def _not_modified(self, file_stat, etag):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return int(file_stat.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _get_range(self, file_size):
+        """
+        Get (start, end) of a single byte range, or None for the whole file.
+        Raise ValueError for an unsatisfiable range.
+        """
+        range_header = self.headers.get('Range')
+        if not range_header or not range_header.startswith('bytes=') or ',' in range_header:
+            return None
+        start, _, end = range_header[len('bytes='):].strip().partition('-')
+        if start:
+            start = int(start)
+            end = min(int(end), file_size - 1) if end else file_size - 1
+        elif end:
+            start = max(file_size - int(end), 0)
+            end = file_size - 1
+        else:
+            return None
+        if start >= file_size or start > end:
+            raise ValueError("Range not satisfiable")
+        return start, end
+
+    def _serve_file(self, send_body):
+        if not self._authorized():
+            return
+        file_path = self._get_file_path()
+        if not file_path or not os.path.exists(file_path):
+            self._send_empty(404)
+            return
+        if os.path.isdir(file_path):
+            self._send_empty(200, {'Content-Type': 'text/html'})
+            return
+
+        file_stat = os.stat(file_path)
+        etag, last_modified = self._get_validators(file_stat)
+        validators = {'ETag': etag, 'Last-Modified': last_modified, 'Accept-Ranges': 'bytes'}
+        if self._not_modified(file_stat, etag):
+            self._send_empty(304, validators)
+            return
+
+        try:
+            byte_range = self._get_range(file_stat.st_size)
+        except ValueError:
+            validators['Content-Range'] = 'bytes */%d' % file_stat.st_size
+            self._send_empty(416, validators)
+            return
+
+        if byte_range:
+            start, end = byte_range
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, end, file_stat.st_size))
+        else:
+            start, end = 0, file_stat.st_size - 1
+            self.send_response(200)
+        for name, value in validators.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+
+        if send_body:
+            with open(file_path, 'rb') as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    data = f.read(min(COPY_BUFFER_SIZE, remaining))
+                    if not data:
+                        break
+                    self.wfile.write(data)
+                    remaining -= len(data)
+
+    def do_HEAD(self):
+        self._serve_file(send_body=False)
+
+    def do_GET(self):
+        self._serve_file(send_body=True)
+
+    def _read_chunked_body(self, f):
+        while True:
+            chunk_size = int(self.rfile.readline().strip().split(b';')[0], 16)
+            if chunk_size == 0:
+                self.rfile.readline()
+                return
+            remaining = chunk_size
+            while remaining > 0:
+                data = self.rfile.read(min(COPY_BUFFER_SIZE, remaining))
+                f.write(data)
+                remaining -= len(data)
+            self.rfile.readline()
+
+    def do_PUT(self):
+        if not self._authorized():
+            return
+        file_path = self._get_file_path()
+        if not file_path or not os.path.isdir(os.path.dirname(file_path)):
+            self._send_empty(404)
+            return
+
+        existed = os.path.exists(file_path)
+        with open(file_path, 'wb') as f:
+            if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+                self._read_chunked_body(f)
+            else:
+                remaining = int(self.headers.get('Content-Length', 0))
+                while remaining > 0:
+                    data = self.rfile.read(min(COPY_BUFFER_SIZE, remaining))
+                    if not data:
+                        break
+                    f.write(data)
+                    remaining -= len(data)
+        self._send_empty(200 if existed else 201)
+
+    def do_DELETE(self):
+        if not self._authorized():
+            return
+        file_path = self._get_file_path()
+        if not file_path or not os.path.exists(file_path):
+            self._send_empty(404)
+            return
+        if os.path.isdir(file_path):
+            shutil.rmtree(file_path)
+        else:
+            os.remove(file_path)
+        self._send_empty(204)
+
+def start_datastore_server(address, root, username, password, plain_http=False):
+    """
+    Start the datastore file server in a daemon thread and return the server
+    """
+    handler = DatastoreFileHandler
+    handler.datastores_dir = os.path.join(root, 'datastores')
+    if username:
+        handler.credentials = 'Basic ' + base64.b64encode(
+            ('%s:%s' % (username, password)).encode('utf-8')).decode('ascii')
+
+    server = ThreadingHTTPServer(split_address(address), handler)
+    server.daemon_threads = True
+    if not plain_http:
+        cert_file, key_file = create_certificate(root)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_file, key_file)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+def start_vcsim(vcsim, address, vcsim_args, username, password, root):
+    """
+    Start vcsim process with its output written to vcsim.log
+    """
+    if not shutil.which(vcsim):
+        raise FileNotFoundError("vcsim executable '%s' is not found. Please install it by\n"
+                                "'go install github.com/vmware/govmomi/vcsim@latest'" % vcsim)
+    vcsim_log = open(os.path.join(root, 'vcsim.log'), 'w')
+    cmd = [vcsim, '-l', address, '-username', username, '-password', password] + vcsim_args.split()
+    return subprocess.Popen(cmd, stdout=vcsim_log, stderr=subprocess.STDOUT)
+
+if __name__ == "__main__":
+    args = parse_arguments()
+
+    vcsim_process = None
+    datastore_server = None
+    stop_event = threading.Event()
+    try:
+        if not os.path.exists(args.root):
+            os.makedirs(args.root)
+
+        log_files = seed_vm_dirs(args.root, args.vms or ['LocalDS_0/DC0_H0_VM0'], args.log_lines)
+        if args.log_append_interval > 0:
+            append_thread = threading.Thread(target=append_logs,
+                                             args=(log_files, args.log_append_interval, stop_event))
+            append_thread.daemon = True
+            append_thread.start()
+
+        datastore_server = start_datastore_server(args.datastore_address, args.root,
+                                                  args.username, args.password, args.plain_http)
+        print("Datastore file server: %s://%s/folder, datastores directory: %s" %
+              ('http' if args.plain_http else 'https', args.datastore_address,
+               os.path.join(args.root, 'datastores')))
+
+        if not args.no_vcsim:
+            vcsim_process = start_vcsim(args.vcsim, args.vcsim_address, args.vcsim_args,
+                                        args.username, args.password, args.root)
+            print("vcsim: https://%s/sdk, log file: %s" %
+                  (args.vcsim_address, os.path.join(args.root, 'vcsim.log')))
+            print("Please export VMWARE_PORT=%d for Ansible VMware modules" %
+                  split_address(args.vcsim_address)[1])
+        sys.stdout.flush()
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        while not stop_event.wait(1):
+            if vcsim_process and vcsim_process.poll() is not None:
+                raise RuntimeError("vcsim exited with return code %d" % vcsim_process.returncode)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        traceback_str = traceback.format_exc()
+        sys.stderr.write(traceback_str)
+        sys.exit(1)
+    finally:
+        stop_event.set()
+        if datastore_server:
+            datastore_server.shutdown()
+        if vcsim_process and vcsim_process.poll() is None:
+            vcsim_process.terminate()
+            vcsim_process.wait()
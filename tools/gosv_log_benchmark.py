@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script benchmarks the callback plugin plugin/ansible_vsphere_gosv_log.py by
+# driving its CallbackModule with synthetic task result streams, without running
+# any playbook. It reports events per second, bytes written to each log file and
+# peak memory, and can save the results as a baseline to compare with later.
+#
+# Examples:
+#   python3 tools/gosv_log_benchmark.py -s /tmp/baseline.json
+#   python3 tools/gosv_log_benchmark.py -c /tmp/baseline.json
+#   python3 tools/gosv_log_benchmark.py -y
+#
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import tempfile
+import tracemalloc
+import contextlib
+import importlib.util
+import yaml
+from argparse import ArgumentParser, RawTextHelpFormatter
+
+from ansible import context
+from ansible.executor.stats import AggregateStats
+from ansible.executor.task_result import TaskResult
+from ansible.inventory.host import Host
+from ansible.module_utils.common.collections import ImmutableDict
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+PLUGIN_PATH = os.path.join(PROJECT_DIR, 'plugin', 'ansible_vsphere_gosv_log.py')
+
+# Synthetic event streams. Each stream generates results of one kind of task event.
+STREAMS = ['ok', 'changed', 'failed', 'skipped', 'loop_items', 'large_result', 'nested_include']
+
+def parse_arguments():
+    parser = ArgumentParser(description="A benchmark of ansible_vsphere_gosv_log callback plugin",
+                            formatter_class=RawTextHelpFormatter)
+    parser.add_argument("-n", dest="events", type=int, default=2000,
+                        help="the number of task events in each stream. Default is 2000")
+    parser.add_argument("-t", dest="testcases", type=int, default=40,
+                        help="the number of test cases the events are spread over. Default is 40")
+    parser.add_argument("-r", dest="streams", action="append", choices=STREAMS, default=None,
+                        help="the stream to run, can be set multiple times. Default is all streams")
+    parser.add_argument("-s", dest="save", default=None,
+                        help="the JSON file path to save benchmark results as a baseline")
+    parser.add_argument("-c", dest="compare", default=None,
+                        help="the JSON file path of baseline results to compare with")
+    parser.add_argument("-v", dest="verbose", action="store_true", default=False,
+                        help="print the console output of the callback plugin")
+    parser.add_argument("-y", dest="yaml_check", action="store_true", default=False,
+                        help="check the YAML loader used by the callback plugin parses project YAML files\n" +
+                             "the same as the pure Python loader, and compare their parsing time")
+    parser.add_argument("-k", dest="keep_logs", action="store_true", default=False,
+                        help="keep the log files written by the callback plugin")
+    return parser.parse_args()
+
+def load_callback_module():
+    spec = importlib.util.spec_from_file_location('ansible_vsphere_gosv_log', PLUGIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class FakePlaybook(object):
+    def __init__(self, file_name):
+        self._file_name = file_name
+
+class FakeDataSource(object):
+    def __init__(self, data_source):
+        self._data_source = data_source
+
+class FakePlay(object):
+    def __init__(self, name, path, vars_files=None):
+        self.name = name
+        self.strategy = 'linear'
+        self._ds = FakeDataSource(path)
+        self._vars_files = vars_files or []
+
+    def get_name(self):
+        return self.name
+
+    def get_vars(self):
+        return {}
+
+    def get_vars_files(self):
+        return self._vars_files
+
+class FakeTask(object):
+    """
+    A task with the attributes and methods used by the callback plugin.
+    The parent chain simulates tasks in nested included files.
+    """
+    def __init__(self, index, name, path, action='ansible.builtin.command',
+                 loop=None, parent=None, tags=None, args=None):
+        self._uuid = 'task-%08d' % index
+        self.name = name
+        self._path = path
+        self.action = action
+        self.loop = loop
+        self.ignore_errors = False
+        self.tags = tags or []
+        self.args = args or {}
+        self._parent = parent
+
+    def get_name(self):
+        return self.name
+
+    def get_path(self):
+        return self._path
+
+    def dump_attrs(self):
+        return {'name': self.name, 'action': self.action}
+
+def make_task(index, stream, depth=1):
+    path = os.path.join(PROJECT_DIR, 'common', 'benchmark_%s.yml:%d' % (stream, index % 100 + 1))
+    parent = None
+    for level in range(depth - 1):
+        parent = FakeTask(index, 'include level %d' % level,
+                          os.path.join(PROJECT_DIR, 'linux', 'utils', 'include_%d.yml:%d' % (level, level + 1)),
+                          action='ansible.builtin.include_tasks', parent=parent)
+    loop = '{{ benchmark_items }}' if stream == 'loop_items' else None
+    return FakeTask(index, 'Benchmark %s task %d' % (stream, index), path, loop=loop, parent=parent)
+
+def make_result(index, stream):
+    result = {'changed': stream == 'changed',
+              'cmd': 'echo benchmark %d' % index,
+              'rc': 0,
+              'stdout': 'benchmark output %d' % index,
+              'stdout_lines': ['benchmark output %d' % index],
+              'stderr': '',
+              'stderr_lines': []}
+    if stream == 'failed':
+        result.update({'failed': True, 'rc': 1,
+                       'msg': 'non-zero return code',
+                       'stderr': 'benchmark error %d' % index,
+                       'stderr_lines': ['benchmark error %d' % index]})
+    elif stream == 'skipped':
+        result = {'changed': False, 'skipped': True, 'skip_reason': 'Conditional result was False'}
+    elif stream == 'large_result':
+        # A result like vm_get_config with whole config subtrees
+        result['instance'] = {'config': {'hardware': {'device': [
+            {'key': key, 'deviceInfo': {'label': 'Device %d' % key, 'summary': 'x' * 200},
+             'backing': {'fileName': '[datastore1] vm/vm_%d.vmdk' % key}}
+            for key in range(200)]}}}
+    return result
+
+def run_stream(callback_module, stream, events, testcases, work_dir):
+    """
+    Drive a new CallbackModule with one event stream and return the measurements
+    """
+    log_path = os.path.join(work_dir, stream)
+    os.makedirs(log_path)
+    vars_file = os.path.join(work_dir, '%s_vars.yml' % stream)
+    with open(vars_file, 'w') as f:
+        f.write('local_log_path: %s\nvm_name: benchmark_vm\n' % log_path)
+
+    testcase_file = os.path.join(work_dir, '%s_testcase_list.yml' % stream)
+    with open(testcase_file, 'w') as f:
+        for case in range(testcases):
+            f.write('- import_playbook: benchmark/benchmark_case_%d.yml\n' % case)
+
+    context.CLIARGS = ImmutableDict({'args': ('main.yml',),
+                                     'extra_vars': ('testing_vars_file=%s testing_testcase_file=%s' %
+                                                    (vars_file, testcase_file),)})
+    host = Host('localhost')
+    stats = AggregateStats()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    callback = callback_module.CallbackModule()
+    callback.v2_playbook_on_start(FakePlaybook(os.path.join(PROJECT_DIR, 'main.yml')))
+
+    events_per_case = max(events // testcases, 1)
+    for index in range(events):
+        if index % events_per_case == 0:
+            case = min(index // events_per_case, testcases - 1)
+            callback.v2_playbook_on_play_start(
+                FakePlay('benchmark_case_%d' % case,
+                         os.path.join(PROJECT_DIR, 'benchmark', 'benchmark_case_%d.yml' % case),
+                         ['{{ testing_vars_file }}']))
+
+        depth = 8 if stream == 'nested_include' else 1
+        task = make_task(index, stream, depth)
+        callback.v2_playbook_on_task_start(task, False)
+        result = make_result(index, stream)
+        if stream == 'loop_items':
+            items = []
+            for item in range(5):
+                item_result = make_result(index, 'ok')
+                item_result['item'] = 'item_%d' % item
+                item_result['ansible_loop_var'] = 'item'
+                callback.v2_runner_item_on_ok(TaskResult(host, task, item_result))
+                items.append(item_result)
+            callback.v2_runner_on_ok(TaskResult(host, task, {'changed': False, 'results': items}))
+        elif stream == 'failed':
+            callback.v2_runner_on_failed(TaskResult(host, task, result))
+        elif stream == 'skipped':
+            callback.v2_runner_on_skipped(TaskResult(host, task, result))
+        elif stream == 'nested_include' and index % 10 == 0:
+            # Failed tasks in nested includes log their call trace
+            result.update({'failed': True, 'msg': 'benchmark failure in nested include'})
+            callback.v2_runner_on_failed(TaskResult(host, task, result), ignore_errors=True)
+        else:
+            callback.v2_runner_on_ok(TaskResult(host, task, result))
+        stats.increment('ok', host.name)
+
+    callback.v2_playbook_on_stats(stats)
+
+    elapsed = time.perf_counter() - start
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Close log file handlers of this run
+    for handler in list(callback.logger.handlers):
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+            callback.logger.removeHandler(handler)
+
+    log_bytes = {}
+    for log_file in sorted(os.listdir(callback.log_dir)):
+        log_file_path = os.path.join(callback.log_dir, log_file)
+        if os.path.isfile(log_file_path):
+            log_bytes[log_file] = os.path.getsize(log_file_path)
+
+    return {'events': events,
+            'seconds': round(elapsed, 3),
+            'events_per_second': round(events / elapsed, 1),
+            'peak_memory_bytes': peak_memory,
+            'log_bytes': log_bytes}
+
+def check_yaml_loader(callback_module):
+    """
+    Check the YAML loader of the callback plugin gets the same data as the pure
+    Python loader for all YAML files in the project, and print parsing time of
+    the pure Python loader, the plugin loader and the plugin cache
+    """
+    yaml_files = []
+    for root, dirs, files in os.walk(PROJECT_DIR):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['logs', 'cache']]
+        yaml_files.extend(os.path.join(root, f) for f in files if f.endswith(('.yml', '.yaml')))
+
+    mismatched = []
+    timing = {'pure Python loader': 0.0, 'plugin loader': 0.0, 'plugin cache': 0.0}
+    for yaml_file in sorted(yaml_files):
+        with open(yaml_file, 'r') as fd:
+            content = fd.read()
+
+        start = time.perf_counter()
+        expected = yaml.load(content, Loader=yaml.Loader)
+        timing['pure Python loader'] += time.perf_counter() - start
+
+        callback_module._yaml_files_cache.pop(os.path.realpath(yaml_file), None)
+        start = time.perf_counter()
+        loaded = callback_module.load_yaml_file(yaml_file)
+        timing['plugin loader'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = callback_module.load_yaml_file(yaml_file)
+        timing['plugin cache'] += time.perf_counter() - start
+
+        if loaded != expected or cached != expected:
+            mismatched.append(os.path.relpath(yaml_file, PROJECT_DIR))
+
+    print("Plugin YAML loader: %s.%s" % (callback_module.YamlLoader.__module__,
+                                         callback_module.YamlLoader.__name__))
+    for name, seconds in timing.items():
+        print("| {:<20} | {:>5} files | {:>10.3f} ms |".format(name, len(yaml_files), seconds * 1000))
+    for yaml_file in mismatched:
+        print("MISMATCH: %s" % yaml_file)
+    return len(mismatched) == 0
+
+def print_results(results, baseline=None):
+    row_format = "| {:<16} | {:>12} | {:>14} | {:>16} | {:>14} |"
+    print(row_format.format("Stream", "Events/sec", "Peak memory KB", "full_debug.log KB", "Baseline diff"))
+    for stream, result in results.items():
+        diff = ''
+        if baseline and stream in baseline:
+            diff = "{:+.1f}%".format((result['events_per_second'] / baseline[stream]['events_per_second'] - 1) * 100)
+        print(row_format.format(stream,
+                                result['events_per_second'],
+                                result['peak_memory_bytes'] // 1024,
+                                result['log_bytes'].get('full_debug.log', 0) // 1024,
+                                diff))
+    for stream, result in results.items():
+        print("%s log files: %s" % (stream, json.dumps(result['log_bytes'])))
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    callback_module = load_callback_module()
+    if args.yaml_check:
+        sys.exit(0 if check_yaml_loader(callback_module) else 1)
+
+    work_dir = tempfile.mkdtemp(prefix='gosv_log_benchmark_')
+
+    try:
+        results = {}
+        for stream in args.streams or STREAMS:
+            with open(os.devnull, 'w') as devnull:
+                with contextlib.redirect_stdout(sys.stdout if args.verbose else devnull):
+                    results[stream] = run_stream(callback_module, stream, args.events,
+                                                 args.testcases, work_dir)
+
+        baseline = None
+        if args.compare:
+            with open(args.compare, 'r') as f:
+                baseline = json.load(f)
+        print_results(results, baseline)
+
+        if args.save:
+            with open(args.save, 'w') as f:
+                json.dump(results, f, indent=4)
+            print("Benchmark results are saved in %s" % args.save)
+    finally:
+        if args.keep_logs:
+            print("Log files are kept in %s" % work_dir)
+        else:
+            shutil.rmtree(work_dir)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script runs a test case list in shards in parallel. It runs the blocker
+# test cases, which provide resources required by other test cases, e.g. deploy_vm
+# and VMware Tools install, on the VM 'vm_name' at first.
+# After they pass, it clones worker VMs from the VM base snapshot, distributes the
+# remaining test cases across the worker VMs, runs main.yml for each shard
+# concurrently with isolated log folders, and then merges the test results of all
+# shards into one summary table.
+#
+# Example:
+#   python3 tools/gosv_shard_run.py -v /path/to/vars/test.yml -t linux/gosv_testcase_list.yml -n 4
+#
+import os
+import sys
+import json
+import time
+import subprocess
+import traceback
+import importlib.util
+from argparse import ArgumentParser, RawTextHelpFormatter
+
+import yaml
+
+from gosv_testcase_scheduler import load_testcases
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+PLUGIN_PATH = os.path.join(PROJECT_DIR, 'plugin', 'ansible_vsphere_gosv_log.py')
+
+def parse_arguments():
+    parser = ArgumentParser(description="Run test cases in shards on cloned VMs in parallel",
+                            formatter_class=RawTextHelpFormatter)
+    parser.add_argument("-v", dest="vars_file", required=True,
+                        help="the testing vars file path")
+    parser.add_argument("-t", dest="testcase_file",
+                        default=os.path.join(PROJECT_DIR, "linux", "gosv_testcase_list.yml"),
+                        help="the test case list file path. Default is linux/gosv_testcase_list.yml")
+    parser.add_argument("-n", dest="shards", type=int, default=2,
+                        help="the number of shards and worker VMs. Default is 2")
+    parser.add_argument("-m", dest="clone_method", choices=["linked", "instant"], default="linked",
+                        help="the method to clone worker VMs.\n" +
+                             "linked - linked clones from the VM base snapshot (default)\n" +
+                             "instant - instant clones from the running VM")
+    parser.add_argument("-w", dest="work_dir", default=None,
+                        help="the directory of shard test case lists, vars files and logs.\n" +
+                             "Default is <local_log_path>/shards/<timestamp>")
+    parser.add_argument("-k", dest="keep_workers", action="store_true", default=False,
+                        help="keep worker VMs after test")
+    parser.add_argument("--ansible-playbook", dest="ansible_playbook", default="ansible-playbook",
+                        help="the ansible-playbook executable. Default is ansible-playbook in PATH")
+    return parser.parse_args()
+
+def load_callback_module():
+    spec = importlib.util.spec_from_file_location('ansible_vsphere_gosv_log', PLUGIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def split_testcases(testcases, shards_count):
+    """
+    Split test cases into the blocker test cases, which are the ones up to the last
+    test case providing resources to others, and shards of the remaining test cases.
+    Consecutive read-only test cases are kept in one shard to share base snapshot reverts.
+    """
+    last_blocker = -1
+    for testcase in testcases:
+        if testcase.provides:
+            last_blocker = testcase.index
+
+    units = []
+    for testcase in testcases[last_blocker + 1:]:
+        if units and testcase.readonly and units[-1][-1].readonly:
+            units[-1].append(testcase)
+        else:
+            units.append([testcase])
+
+    shards = [[] for index in range(shards_count)]
+    for index, unit in enumerate(units):
+        shards[index % shards_count] += [testcase.playbook for testcase in unit]
+
+    return ([testcase.playbook for testcase in testcases[:last_blocker + 1]],
+            [shard for shard in shards if shard])
+
+def write_yaml(file_path, data):
+    if not os.path.exists(os.path.dirname(file_path)):
+        os.makedirs(os.path.dirname(file_path))
+    with open(file_path, 'w') as f:
+        yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+    return file_path
+
+def write_testcase_file(work_dir, suite, name, testcase_dir, playbooks):
+    """
+    Write a test case list file with absolute playbook paths. The file is put in a
+    directory named with the test suite, which is used by main.yml to get test suite.
+    """
+    shard_playbooks = []
+    for playbook in playbooks:
+        shard_playbook = dict(playbook)
+        shard_playbook['import_playbook'] = os.path.join(testcase_dir, playbook['import_playbook'])
+        shard_playbooks.append(shard_playbook)
+    return write_yaml(os.path.join(work_dir, suite, name + '.yml'), shard_playbooks)
+
+def write_vars_file(work_dir, name, testing_vars, **overrides):
+    shard_vars = dict(testing_vars)
+    shard_vars.update(overrides)
+    return write_yaml(os.path.join(work_dir, name, name + '_vars.yml'), shard_vars)
+
+def start_playbook(ansible_playbook, playbook, log_file, extra_vars):
+    cmd = [ansible_playbook, playbook]
+    for key, value in extra_vars.items():
+        # The callback plugin only parses extra vars in format of key=value
+        if isinstance(value, str):
+            cmd += ['-e', '{}={}'.format(key, value)]
+        else:
+            cmd += ['-e', json.dumps({key: value})]
+    print("Running: %s\nOutput: %s" % (' '.join(cmd), log_file))
+    sys.stdout.flush()
+    log_fd = open(log_file, 'w')
+    return subprocess.Popen(cmd, cwd=PROJECT_DIR, stdout=log_fd, stderr=subprocess.STDOUT)
+
+def run_playbook(ansible_playbook, playbook, log_file, extra_vars):
+    return start_playbook(ansible_playbook, playbook, log_file, extra_vars).wait()
+
+def get_results_file(log_path):
+    # The callback plugin links the log folder of the latest test run to 'current'
+    return os.path.join(log_path, 'current', 'test_results.json')
+
+def blocker_passed(results_file):
+    if not os.path.exists(results_file):
+        return False
+    with open(results_file, 'r') as f:
+        test_runs = json.load(f).get('test_runs', [])
+    return all(test_run['status'] not in ['Failed', 'Blocked', 'No Run'] for test_run in test_runs)
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    start_time = time.time()
+
+    try:
+        vars_file = os.path.realpath(args.vars_file)
+        testcase_file = os.path.realpath(args.testcase_file)
+        with open(vars_file, 'r') as f:
+            testing_vars = yaml.safe_load(f) or {}
+        _, testcases = load_testcases(testcase_file)
+
+        suite = os.path.basename(os.path.dirname(testcase_file))
+        testcase_dir = os.path.dirname(testcase_file)
+        work_dir = args.work_dir or os.path.join(testing_vars.get('local_log_path') or
+                                                 os.path.join(PROJECT_DIR, 'logs'),
+                                                 'shards', time.strftime("%Y-%m-%d-%H-%M-%S"))
+        work_dir = os.path.realpath(work_dir)
+        main_playbook = os.path.join(PROJECT_DIR, 'main.yml')
+        results_files = []
+
+        blockers, shards = split_testcases(testcases, args.shards)
+        print("Test cases: %d blockers, %d in %d shards" % (len(blockers), len(testcases) - len(blockers), len(shards)))
+
+        # Run blocker test cases on the VM and keep the VM for cloning
+        base_ready = True
+        if blockers:
+            base_log_path = os.path.join(work_dir, 'base')
+            base_vars_file = write_vars_file(work_dir, 'base', testing_vars,
+                                             local_log_path=base_log_path,
+                                             cleanup_vm=False)
+            base_testcase_file = write_testcase_file(work_dir, suite, 'base', testcase_dir, blockers)
+            run_playbook(args.ansible_playbook, main_playbook,
+                         os.path.join(base_log_path, 'ansible-playbook.log'),
+                         {'testing_vars_file': base_vars_file,
+                          'testing_testcase_file': base_testcase_file})
+            results_files.append(get_results_file(base_log_path))
+            base_ready = blocker_passed(results_files[-1])
+
+        if base_ready and shards:
+            worker_vm_names = ['%s_shard%d' % (testing_vars['vm_name'], index + 1)
+                               for index in range(len(shards))]
+            workers_vars_file = write_vars_file(work_dir, 'workers', testing_vars, new_vm=False)
+            workers_log_path = os.path.join(work_dir, 'workers')
+            workers_playbook = os.path.join(PROJECT_DIR, 'env_setup', 'shard_workers.yml')
+            rc = run_playbook(args.ansible_playbook, workers_playbook,
+                              os.path.join(workers_log_path, 'create_workers.log'),
+                              {'testing_vars_file': workers_vars_file,
+                               'shard_workers_action': 'create',
+                               'shard_worker_vm_names': worker_vm_names,
+                               'shard_clone_method': args.clone_method})
+            if rc != 0:
+                raise RuntimeError("Failed to create worker VMs. Please check %s" %
+                                   os.path.join(workers_log_path, 'create_workers.log'))
+
+            # Run shards on worker VMs in parallel
+            processes = []
+            for index, shard in enumerate(shards):
+                shard_name = 'shard%d' % (index + 1)
+                shard_log_path = os.path.join(work_dir, shard_name)
+                shard_vars_file = write_vars_file(work_dir, shard_name, testing_vars,
+                                                  vm_name=worker_vm_names[index],
+                                                  new_vm=False,
+                                                  cleanup_vm=False,
+                                                  local_log_path=shard_log_path)
+                shard_testcase_file = write_testcase_file(work_dir, suite, shard_name, testcase_dir, shard)
+                processes.append(start_playbook(args.ansible_playbook, main_playbook,
+                                                os.path.join(shard_log_path, 'ansible-playbook.log'),
+                                                {'testing_vars_file': shard_vars_file,
+                                                 'testing_testcase_file': shard_testcase_file}))
+                results_files.append(get_results_file(shard_log_path))
+
+            for process in processes:
+                process.wait()
+
+            if not args.keep_workers:
+                run_playbook(args.ansible_playbook, workers_playbook,
+                             os.path.join(workers_log_path, 'remove_workers.log'),
+                             {'testing_vars_file': workers_vars_file,
+                              'shard_workers_action': 'remove',
+                              'shard_worker_vm_names': worker_vm_names})
+
+        # Merge test results of all shards
+        callback_module = load_callback_module()
+        test_runs, _ = callback_module.merge_test_results(results_files, testcase_file)
+        callback_module.block_dependent_test_runs(test_runs, [testcase.playbook for testcase in testcases],
+                                                  blocked=not base_ready)
+        msg = callback_module.format_test_results(test_runs, int(time.time() - start_time))
+        with open(os.path.join(work_dir, 'results.log'), 'w') as f:
+            f.write(msg)
+        print(msg)
+        print("Test results of all shards are merged into %s" % os.path.join(work_dir, 'results.log'))
+
+        if any(test_run.status in ['Failed', 'Blocked', 'No Run'] for test_run in test_runs.values()):
+            sys.exit(1)
+    except Exception:
+        traceback_str = traceback.format_exc()
+        sys.stderr.write(traceback_str)
+        sys.exit(1)
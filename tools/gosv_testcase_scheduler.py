@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script validates and orders test cases in a test case list file according
+# to their declared dependencies in import_playbook vars:
+#   testcase_requires: the resources or capabilities required by test case
+#   testcase_provides: the resources provided by test case
+#   testcase_readonly: test case does not change VM or guest OS
+#   testcase_destructive: test case changes VM state which later test cases depend on
+#
+# Test cases are ordered as close to their original order as possible, with below rules:
+# 1. A test case runs after all test cases providing the resources it requires.
+# 2. No test case is moved across a destructive test case.
+# 3. Read-only test cases between two destructive test cases are grouped together,
+#    so that they can share one base snapshot revert at runtime.
+#
+# Example:
+#   python3 tools/gosv_testcase_scheduler.py -t linux/gosv_testcase_list.yml -c
+#   python3 tools/gosv_testcase_scheduler.py -t linux/gosv_testcase_list.yml -o /tmp/linux/scheduled_list.yml
+#
+import os
+import sys
+import heapq
+from argparse import ArgumentParser
+
+import yaml
+
+# Requirements which are not provided by test cases, but checked at runtime
+CAPABILITIES = ['efi']
+
+class TestCase(object):
+    def __init__(self, index, playbook, text):
+        testcase_vars = playbook.get('vars') or {}
+        self.index = index
+        self.name = os.path.basename(playbook['import_playbook']).replace('.yml', '')
+        self.playbook = playbook
+        self.text = text
+        self.requires = testcase_vars.get('testcase_requires') or []
+        self.provides = testcase_vars.get('testcase_provides') or []
+        self.readonly = bool(testcase_vars.get('testcase_readonly', False))
+        self.destructive = bool(testcase_vars.get('testcase_destructive', False))
+
+def parse_arguments():
+    parser = ArgumentParser(description="Validate and order test cases by their dependencies")
+    parser.add_argument("-t", dest="testcase_file", required=True,
+                        help="the test case list file path")
+    parser.add_argument("-o", dest="output_file",
+                        help="the file path to write ordered test case list. Default is stdout")
+    parser.add_argument("-c", dest="check_only", action="store_true", default=False,
+                        help="only validate dependencies and print the schedule")
+    return parser.parse_args()
+
+def load_testcases(testcase_file):
+    """
+    Load test cases with the original text of each test case entry, so that
+    comments and formatting are kept when writing ordered test case list
+    """
+    with open(testcase_file, 'r') as f:
+        content = f.read()
+    playbooks = yaml.safe_load(content) or []
+
+    header = []
+    entries = []
+    for line in content.splitlines(True):
+        if line.startswith('- import_playbook:'):
+            entries.append([line])
+        elif entries:
+            entries[-1].append(line)
+        else:
+            header.append(line)
+
+    if len(entries) != len(playbooks):
+        raise ValueError("Failed to parse test case entries in %s" % testcase_file)
+
+    return ''.join(header), [TestCase(index, playbook, ''.join(entries[index]))
+                             for index, playbook in enumerate(playbooks)]
+
+def get_unknown_requirements(testcases):
+    provided = set(CAPABILITIES)
+    for testcase in testcases:
+        provided.update(testcase.provides)
+    return [(testcase.name, requirement)
+            for testcase in testcases
+            for requirement in testcase.requires
+            if requirement not in provided]
+
+def schedule_testcases(testcases):
+    """
+    Order test cases by dependencies with a stable topological sort
+    :return: the ordered test cases
+    """
+    successors = dict((testcase.index, set()) for testcase in testcases)
+
+    # Test cases run after their required resources providers
+    for testcase in testcases:
+        for provider in testcases:
+            if (provider.index != testcase.index and
+                    set(provider.provides).intersection(testcase.requires)):
+                successors[provider.index].add(testcase.index)
+
+    # Test cases are not moved across destructive test cases, and read-only test cases
+    # are grouped at the position of the first read-only test case in each segment
+    group_pos = {}
+    first_readonly = None
+    for testcase in testcases:
+        if testcase.destructive:
+            first_readonly = None
+            for other in testcases:
+                if other.index < testcase.index:
+                    successors[other.index].add(testcase.index)
+                elif other.index > testcase.index:
+                    successors[testcase.index].add(other.index)
+        elif testcase.readonly:
+            if first_readonly is None:
+                first_readonly = testcase.index
+            group_pos[testcase.index] = first_readonly
+
+    predecessors_count = dict((testcase.index, 0) for testcase in testcases)
+    for index in successors:
+        for successor in successors[index]:
+            predecessors_count[successor] += 1
+
+    ready = [(group_pos.get(testcase.index, testcase.index), testcase.index)
+             for testcase in testcases if predecessors_count[testcase.index] == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, index = heapq.heappop(ready)
+        ordered.append(testcases[index])
+        for successor in successors[index]:
+            predecessors_count[successor] -= 1
+            if predecessors_count[successor] == 0:
+                heapq.heappush(ready, (group_pos.get(successor, successor), successor))
+
+    if len(ordered) != len(testcases):
+        unscheduled = [testcase.name for testcase in testcases if testcase not in ordered]
+        raise ValueError("Dependency cycle found in test cases: %s" % ', '.join(unscheduled))
+
+    return ordered
+
+def get_shared_reverts(ordered):
+    """
+    Get the number of read-only test cases which follow another read-only test case,
+    and can skip reverting to base snapshot
+    """
+    return len([index for index in range(1, len(ordered))
+                if ordered[index].readonly and ordered[index - 1].readonly])
+
+if __name__ == "__main__":
+    args = parse_arguments()
+
+    try:
+        header, testcases = load_testcases(args.testcase_file)
+        unknown_requirements = get_unknown_requirements(testcases)
+        for name, requirement in unknown_requirements:
+            sys.stderr.write("Test case %s requires '%s', which is not provided by any test case\n" %
+                             (name, requirement))
+        if unknown_requirements:
+            sys.exit(1)
+
+        ordered = schedule_testcases(testcases)
+        sys.stderr.write("Scheduled %d test cases, %d moved, %d base snapshot reverts shared\n" %
+                         (len(ordered),
+                          len([position for position, testcase in enumerate(ordered)
+                               if testcase.index != position]),
+                          get_shared_reverts(ordered)))
+
+        if args.check_only:
+            for position, testcase in enumerate(ordered):
+                flags = [flag for flag, enabled in [('readonly', testcase.readonly),
+                                                    ('destructive', testcase.destructive)] if enabled]
+                sys.stderr.write("%3d %-40s %s\n" % (position + 1, testcase.name, ' '.join(flags)))
+            sys.exit(0)
+
+        content = header + ''.join(testcase.text if testcase.text.endswith('\n') else testcase.text + '\n'
+                                   for testcase in ordered)
+        if args.output_file:
+            with open(args.output_file, 'w') as f:
+                f.write(content)
+        else:
+            sys.stdout.write(content)
+    except (IOError, ValueError, yaml.YAMLError) as e:
+        sys.stderr.write("%s\n" % e)
+        sys.exit(1)
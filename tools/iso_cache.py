@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script downloads an OS installation ISO file into a content-addressed local
+# ISO cache, in which ISO files are named by their checksums, so that ISO files with
+# the same file name from different URLs don't collide, and an ISO file is downloaded
+# only once for all test runs.
+# A partial download is kept in cache folder with the ETag or Last-Modified of ISO file,
+# and resumed in next run with an HTTP Range request, which has an If-Range header of
+# the saved ETag or Last-Modified, so that it is downloaded from the beginning again
+# if ISO file has changed. When the cache size exceeds the maximum size, the least recently used
+# ISO files are removed.
+# The cache index file 'index.json' in cache folder records the checksum, URL, size
+# and last used time of each cached ISO file.
+# The result is printed in JSON with keys:
+#   path: the path of ISO file in local cache
+#   key: the content key of ISO file in format '<algorithm>-<checksum>'
+#   size: the size of ISO file
+#   cache_hit: true if ISO file is in cache already
+#   resumed_bytes: the bytes of partial download resumed from
+#   downloaded_bytes: the bytes downloaded in this run
+#   evicted: the content keys of ISO files removed from cache
+#
+# Example:
+#   python3 iso_cache.py -u 'https://mirror/os.iso' -c 'sha256:xxxxxxxx' -d cache/iso_cache -s 50
+#
+import os
+import re
+import ssl
+import sys
+import json
+import time
+import hashlib
+import traceback
+from argparse import ArgumentParser
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+
+CHUNK_SIZE = 1024 * 1024
+INDEX_FILE = 'index.json'
+
+def parse_arguments():
+    parser = ArgumentParser(description="Download an ISO file into content-addressed local ISO cache")
+    parser.add_argument("-u", dest="url", required=True,
+                        help="the URL of ISO file")
+    parser.add_argument("-c", dest="checksum", default="",
+                        help="the checksum of ISO file in format '<algorithm>:<checksum>', e.g. 'sha256:xxxx'")
+    parser.add_argument("-d", dest="cache_dir", required=True,
+                        help="the local ISO cache folder")
+    parser.add_argument("-s", dest="max_size_gb", type=float, default=50,
+                        help="the maximum size of ISO cache in GB, 0 for unlimited. Default is 50")
+    parser.add_argument("-k", dest="validate_certs", action="store_true", default=False,
+                        help="validate server certificate")
+    return parser.parse_args()
+
+class IsoCache(object):
+    def __init__(self, cache_dir, validate_certs=False):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, INDEX_FILE)
+        self.ssl_context = ssl.create_default_context()
+        if not validate_certs:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        os.makedirs(cache_dir, exist_ok=True)
+        self.downloaded_bytes = 0
+        self.index = {}
+        if os.path.isfile(self.index_path):
+            with open(self.index_path) as index_file:
+                self.index = json.load(index_file)
+        # Remove index entries whose ISO files were removed manually
+        self.index = dict((key, entry) for key, entry in self.index.items()
+                          if os.path.isfile(self._path(key)))
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.iso')
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as index_file:
+            json.dump(self.index, index_file, indent=4, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def lookup(self, url, checksum):
+        """
+        Look up ISO file in cache by its checksum, or by its URL when checksum is not given
+        :return: the content key of cached ISO file, or None
+        """
+        if checksum:
+            key = checksum.replace(':', '-', 1).lower()
+            return key if key in self.index else None
+        for key, entry in self.index.items():
+            if entry.get('url') == url:
+                return key
+        return None
+
+    def download(self, url, checksum):
+        """
+        Download ISO file to a partial file, which is resumed if it exists
+        :return: the content key of downloaded ISO file, and the resumed bytes
+        """
+        algorithm = checksum.split(':', 1)[0].lower() if checksum else 'sha256'
+        part_path = os.path.join(self.cache_dir,
+                                 hashlib.sha1(url.encode('utf-8')).hexdigest() + '.part')
+        validator_path = part_path + '.validator'
+        validator = ''
+        if os.path.isfile(part_path) and os.path.isfile(validator_path):
+            with open(validator_path) as validator_file:
+                validator = validator_file.read().strip()
+        # A partial file without validator can't be resumed safely
+        resumed_bytes = os.path.getsize(part_path) if validator else 0
+        headers = {'Range': 'bytes=%d-' % resumed_bytes, 'If-Range': validator} if resumed_bytes else {}
+        try:
+            response = urlopen(Request(url, headers=headers), context=self.ssl_context)
+        except HTTPError as e:
+            # The partial file is complete already
+            if e.code != 416 or not resumed_bytes:
+                raise
+            response = None
+
+        if response is not None:
+            with response:
+                if resumed_bytes and response.status != 206:
+                    # ISO file has changed, or server doesn't support Range request,
+                    # download from the beginning
+                    resumed_bytes = 0
+                if not resumed_bytes:
+                    # Weak ETag can't be used in If-Range
+                    etag = response.headers.get('ETag') or ''
+                    validator = ('' if etag.startswith('W/') else etag) or response.headers.get('Last-Modified') or ''
+                    with open(validator_path, 'w') as validator_file:
+                        validator_file.write(validator)
+                with open(part_path, 'ab' if resumed_bytes else 'wb') as part_file:
+                    while True:
+                        chunk = response.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        part_file.write(chunk)
+                        self.downloaded_bytes += len(chunk)
+
+        digest = hashlib.new(algorithm)
+        with open(part_path, 'rb') as part_file:
+            for chunk in iter(lambda: part_file.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+        os.remove(validator_path)
+        if checksum and digest.hexdigest() != checksum.split(':', 1)[1].lower():
+            os.remove(part_path)
+            raise Exception("The checksum of downloaded file is %s:%s, not the expected %s" %
+                            (algorithm, digest.hexdigest(), checksum))
+
+        key = '%s-%s' % (algorithm, digest.hexdigest())
+        os.replace(part_path, self._path(key))
+        return key, resumed_bytes
+
+    def evict(self, max_size, keep_key):
+        """
+        Remove the least recently used ISO files until cache size is not larger than max_size
+        :return: the content keys of removed ISO files
+        """
+        evicted = []
+        total_size = sum(entry['size'] for entry in self.index.values())
+        for key in sorted(self.index, key=lambda k: self.index[k]['last_used']):
+            if max_size <= 0 or total_size <= max_size:
+                break
+            if key == keep_key:
+                continue
+            os.remove(self._path(key))
+            total_size -= self.index.pop(key)['size']
+            evicted.append(key)
+        return evicted
+
+    def get(self, url, checksum, max_size):
+        resumed_bytes = 0
+        key = self.lookup(url, checksum)
+        cache_hit = key is not None
+        if not cache_hit:
+            key, resumed_bytes = self.download(url, checksum)
+
+        path = self._path(key)
+        self.index[key] = {'url': url,
+                           'file_name': os.path.basename(url.split('?')[0]),
+                           'size': os.path.getsize(path),
+                           'last_used': int(time.time())}
+        evicted = self.evict(max_size, key)
+        self._save_index()
+        return {'path': os.path.abspath(path),
+                'key': key,
+                'size': self.index[key]['size'],
+                'cache_hit': cache_hit,
+                'resumed_bytes': resumed_bytes,
+                'downloaded_bytes': self.downloaded_bytes,
+                'evicted': evicted}
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        if args.checksum and not re.match(r'^\w+:[0-9a-fA-F]+$', args.checksum):
+            raise Exception("Invalid checksum '%s', it must be in format '<algorithm>:<checksum>'" % args.checksum)
+        iso_cache = IsoCache(args.cache_dir, validate_certs=args.validate_certs)
+        result = iso_cache.get(args.url, args.checksum, int(args.max_size_gb * 1024 ** 3))
+        print(json.dumps(result))
+    except Exception:
+        sys.stderr.write(traceback.format_exc())
+        sys.exit(1)
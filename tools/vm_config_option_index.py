@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script parses VM config option XML file /etc/vmware/hostd/env/vmconfigoption-esx-hwNN.xml
+# fetched from ESXi server into a JSON index of all guest IDs default config options,
+# so that guest config options of any guest ID can be looked up without parsing XML again.
+#
+# Example:
+#   python3 vm_config_option_index.py -x vmconfigoption-esx-hw21.xml -o vmconfigoption-esx-hw21.json -b 24022510 -w 21
+#
+import re
+import sys
+import json
+import traceback
+import xml.etree.ElementTree as ET
+from argparse import ArgumentParser
+
+# Map device types in config options to the device names used in test cases
+VM_DEVICE_TYPES = {
+    'vim.vm.device.VirtualLsiLogicController': 'lsilogic',
+    'vim.vm.device.VirtualLsiLogicSASController': 'lsilogicsas',
+    'vim.vm.device.ParaVirtualSCSIController': 'paravirtual',
+    'vim.vm.device.VirtualAHCIController': 'sata',
+    'vim.vm.device.VirtualNVMEController': 'nvme',
+    'vim.vm.device.VirtualIDEController': 'ide',
+    'vim.vm.device.VirtualBusLogicController': 'buslogic',
+    'vim.vm.device.VirtualVmxnet3': 'vmxnet3',
+    'vim.vm.device.VirtualE1000e': 'e1000e',
+    'vim.vm.device.VirtualE1000': 'e1000',
+    'vim.vm.device.VirtualVmxnet3Vrdma': 'pvrdma',
+    'vim.vm.device.VirtualSriovEthernetCard': 'sriov',
+    'vim.vm.device.VirtualPCNet32': 'pcnet32',
+    'vim.vm.device.VirtualVmxnet2': 'vmxnet2',
+    'vim.vm.device.VirtualVmxnet': 'vmxnet',
+    'vim.vm.device.VirtualUSBController': 'usb2',
+    'vim.vm.device.VirtualUSBXHCIController': 'usb3',
+}
+
+# Map guest OS descriptor properties to the guest config options names
+VM_CONFIG_NAME = {
+    'id': 'guest_id',
+    'recommendedCdromController': 'default_cdrom_controller',
+    'numRecommendedCoresPerSocket': 'rec_cpu_cores_per_socket',
+    'numRecommendedPhysicalSockets': 'rec_cpu_socket',
+    'recommendedUSBController': 'default_usb_controller',
+    'recommendedDiskController': 'default_disk_controller',
+    'recommendedDiskSizeMB': 'rec_disk_mb',
+    'recommendedFirmware': 'rec_firmware',
+    'recommendedMemMB': 'rec_memory_mb',
+    'recommendedEthernetCard': 'default_ethernet',
+    'defaultSecureBoot': 'default_secure_boot',
+    'supportsSecureBoot': 'support_secure_boot',
+    'fullName': 'guest_fullname',
+    'vRAMSizeInKB': 'rec_vram_kb',
+    'supportsCpuHotAdd': 'support_cpu_hotadd',
+    'supportsMemoryHotAdd': 'support_memory_hotadd',
+    'supportedForCreate': 'support_for_create',
+    'recommendedPersistentMemoryMB': 'rec_persistent_memory',
+    'supportedMinPersistentMemoryMB': 'support_min_persistent_mem_mb',
+    'persistentMemorySupported': 'support_persistent_memory',
+    'supportsTPM20': 'support_tpm_20',
+    'supportedDiskControllerList': 'support_disk_controller',
+    'supportedEthernetCard': 'support_ethernet_card',
+    'supportedUSBControllerList': 'support_usb_controller',
+}
+
+SUPPORTED_DEVICE_LISTS = ['supportedDiskControllerList', 'supportedEthernetCard', 'supportedUSBControllerList']
+
+def parse_arguments():
+    parser = ArgumentParser(description="Parse VM config option XML file into a JSON index of guest config options")
+    parser.add_argument("-x", dest="xml_file", required=True,
+                        help="the VM config option XML file path")
+    parser.add_argument("-o", dest="index_file", required=True,
+                        help="the JSON index file path to write")
+    parser.add_argument("-b", dest="esxi_build", required=True,
+                        help="the ESXi build where the XML file is fetched from")
+    parser.add_argument("-w", dest="hardware_version", type=int, required=True,
+                        help="the hardware version of the XML file")
+    return parser.parse_args()
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def convert_value(name, text):
+    """
+    Convert property value in the same way as esxi_get_guest_config_options_xml.yml did
+    """
+    if text in ['true', 'false']:
+        return text == 'true'
+    if text in VM_DEVICE_TYPES:
+        return VM_DEVICE_TYPES[text]
+    if name == 'fullName' and 'Arm' in text:
+        text = text.replace(' Arm', '')
+    if re.match(r'\d+', text):
+        try:
+            return int(text)
+        except ValueError:
+            return 0
+    return text
+
+def parse_guest_descriptor(descriptor, hardware_version):
+    options = dict((name, '') for name in VM_CONFIG_NAME.values())
+    options['hardware_version'] = 'vmx-{}'.format(hardware_version)
+
+    for element in descriptor:
+        name = local_name(element.tag)
+        if name not in VM_CONFIG_NAME:
+            continue
+
+        children = list(element)
+        if not children and not element.attrib:
+            options[VM_CONFIG_NAME[name]] = convert_value(name, (element.text or '').strip())
+        elif name == 'vRAMSizeInKB':
+            for child in children:
+                if local_name(child.tag) == 'defaultValue' and re.match(r'\d+', (child.text or '').strip()):
+                    options['rec_vram_kb'] = int(child.text.strip())
+        elif name in SUPPORTED_DEVICE_LISTS:
+            devices = [(child.text or '').strip() for child in children if local_name(child.tag) == 'e']
+            options[VM_CONFIG_NAME[name]] = [VM_DEVICE_TYPES[device] for device in devices
+                                             if device in VM_DEVICE_TYPES]
+
+    return options
+
+def build_index(xml_file, esxi_build, hardware_version):
+    guest_ids = []
+    guest_config_options = {}
+    root = ET.parse(xml_file).getroot()
+    for option in root.iter():
+        if local_name(option.tag) != 'guestOSDescriptor':
+            continue
+        for descriptor in option:
+            if local_name(descriptor.tag) != 'e':
+                continue
+            options = parse_guest_descriptor(descriptor, hardware_version)
+            # The first descriptor of a guest ID is used
+            if options['guest_id'] and options['guest_id'] not in guest_config_options:
+                guest_ids.append(options['guest_id'])
+                guest_config_options[options['guest_id']] = options
+
+    return {'esxi_build': esxi_build,
+            'hardware_version': hardware_version,
+            'guest_ids': guest_ids,
+            'guest_config_options': guest_config_options}
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        index = build_index(args.xml_file, args.esxi_build, args.hardware_version)
+        if len(index['guest_ids']) == 0:
+            sys.stderr.write("No guest OS descriptor is found in {}\n".format(args.xml_file))
+            sys.exit(1)
+        with open(args.index_file, 'w') as f:
+            json.dump(index, f, separators=(',', ':'))
+        print("Indexed {} guest IDs of hardware version {} into {}".format(
+              len(index['guest_ids']), args.hardware_version, args.index_file))
+    except Exception:
+        sys.stderr.write(traceback.format_exc())
+        sys.exit(1)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# Copyright 2026 VMware, Inc.
+# SPDX-License-Identifier: BSD-2-Clause
+#
+# This script follows a log file in VM folder through its datastore file URL, and
+# waits for a message appearing at least specified times. At each poll it only
+# downloads the bytes appended since last poll with an HTTP Range request, and
+# counts the matches of the new complete lines, so that a poll does not download
+# and scan the whole log file again. Each Range request also gets the last bytes
+# scanned before, so that a replaced or rotated log file is detected when these
+# bytes change, and it is followed from the beginning.
+# The log file is polled at once, and then with delays starting from 1 second and
+# doubling up to the retry delay, until the message appears or the deadline of
+# retries * delay seconds is reached. Server errors and network errors of a poll
+# are retried until the deadline.
+# The datastore username and password are read from environment variables
+# VM_LOG_FOLLOWER_USERNAME and VM_LOG_FOLLOWER_PASSWORD.
+# The result is printed in JSON with keys:
+#   success: true if the message appears at least specified times
+#   matches: the list of matches found in log file
+#   offset: the bytes of log file scanned
+#   polls: the times of polling log file
+#   elapsed: the seconds waited for the message
+#   bytes_downloaded: the total bytes downloaded
+#   missing: true if the log file doesn't exist at the first poll
+#   errors: the times of server errors or network errors of polls
+#   last_error: the last server error or network error
+#
+# Example:
+#   python3 vm_log_follower.py -u 'https://esxi/folder/vm/vmware.log?dcPath=ha-datacenter&dsName=ds1' \
+#     -m 'Tools: Changing running status' -t 1 -r 60 -d 5
+#
+import os
+import re
+import ssl
+import sys
+import json
+import time
+import base64
+import random
+import traceback
+from argparse import ArgumentParser
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
+
+# The bytes scanned before to check at each poll whether log file is replaced
+OVERLAP_SIZE = 256
+REQUEST_TIMEOUT = 60
+
+def parse_arguments():
+    parser = ArgumentParser(description="Wait for a message appearing in a VM log file in datastore")
+    parser.add_argument("-u", dest="url", required=True,
+                        help="the datastore file URL of VM log file")
+    parser.add_argument("-m", dest="msg_regexp", required=True,
+                        help="the regular expression of message to wait for")
+    parser.add_argument("-t", dest="msg_times", type=int, default=1,
+                        help="the at least times the message appearing. Default is 1")
+    parser.add_argument("-r", dest="retries", type=int, default=60,
+                        help="the times to re-check log file. Default is 60")
+    parser.add_argument("-d", dest="delay", type=float, default=5,
+                        help="seconds to delay for a retry. Default is 5")
+    parser.add_argument("-k", dest="validate_certs", action="store_true", default=False,
+                        help="validate server certificate")
+    return parser.parse_args()
+
+class LogFollower(object):
+    def __init__(self, url, msg_regexp, username=None, password=None, validate_certs=False):
+        self.url = url
+        self.msg_pattern = re.compile(msg_regexp)
+        self.headers = {}
+        if username:
+            credential = ('%s:%s' % (username, password or '')).encode('utf-8')
+            self.headers['Authorization'] = 'Basic ' + base64.b64encode(credential).decode('ascii')
+        self.ssl_context = ssl.create_default_context()
+        if not validate_certs:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        self.offset = 0
+        self.overlap = b''
+        self.matches = []
+        self.polls = 0
+        self.bytes_downloaded = 0
+        self.missing = False
+        self.errors = 0
+        self.last_error = ''
+
+    def _get(self, offset):
+        """
+        Get log content from offset to the end
+        :return: the file size, the offset of returned content, and the content
+        """
+        headers = dict(self.headers)
+        if offset > 0:
+            headers['Range'] = 'bytes=%d-' % offset
+        try:
+            response = urlopen(Request(self.url, headers=headers), context=self.ssl_context,
+                               timeout=REQUEST_TIMEOUT)
+        except HTTPError as e:
+            if e.code == 416:
+                # Nothing appended, or log file is truncated
+                content_range = e.headers.get('Content-Range', '')
+                size = re.search(r'/(\d+)$', content_range)
+                return (int(size.group(1)) if size else offset), offset, b''
+            raise
+
+        with response:
+            content = response.read()
+            content_range = re.match(r'bytes (\d+)-\d+/(\d+)', response.headers.get('Content-Range') or '')
+            self.bytes_downloaded += len(content)
+            if response.status == 206 and content_range:
+                return int(content_range.group(2)), int(content_range.group(1)), content
+            # Server ignores Range header and returns the whole file
+            return len(content), 0, content
+
+    def _follow(self):
+        overlap_start = self.offset - len(self.overlap)
+        size, start, content = self._get(overlap_start)
+        if size < self.offset or content[overlap_start - start:self.offset - start] != self.overlap:
+            # Log file is truncated or replaced, follow it from the beginning
+            self.offset = 0
+            self.overlap = b''
+            self.matches = []
+            if start > 0:
+                size, start, content = self._get(0)
+
+        content = content[self.offset - start:]
+        # Only scan complete lines, the incomplete last line is read again in next poll
+        complete_len = content.rfind(b'\n') + 1
+        if complete_len > 0:
+            text = content[:complete_len].decode('utf-8', errors='replace')
+            self.matches += self.msg_pattern.findall(text)
+            self.offset += complete_len
+            self.overlap = (self.overlap + content[:complete_len])[-OVERLAP_SIZE:]
+
+    def poll(self):
+        self.polls += 1
+        try:
+            self._follow()
+        except HTTPError as e:
+            if e.code < 500:
+                raise
+            self.errors += 1
+            self.last_error = 'HTTP Error %d: %s' % (e.code, e.reason)
+        except (URLError, OSError) as e:
+            # Connection errors and timeouts, which are retried in next poll
+            self.errors += 1
+            self.last_error = str(getattr(e, 'reason', e))
+
+    def wait(self, msg_times, retries, delay):
+        deadline = time.time() + retries * delay
+        backoff_delay = min(1, delay)
+        # The first poll also checks the log file exists
+        try:
+            self.poll()
+        except HTTPError as e:
+            if e.code != 404:
+                raise
+            self.missing = True
+            return False
+        while True:
+            if len(self.matches) >= msg_times:
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(backoff_delay * random.uniform(0.8, 1.2), remaining))
+            backoff_delay = min(backoff_delay * 2, delay)
+            self.poll()
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        follower = LogFollower(args.url, args.msg_regexp,
+                               username=os.environ.get('VM_LOG_FOLLOWER_USERNAME'),
+                               password=os.environ.get('VM_LOG_FOLLOWER_PASSWORD'),
+                               validate_certs=args.validate_certs)
+        start_time = time.time()
+        success = follower.wait(args.msg_times, args.retries, args.delay)
+        print(json.dumps({'success': success,
+                          'matches': follower.matches,
+                          'offset': follower.offset,
+                          'polls': follower.polls,
+                          'elapsed': round(time.time() - start_time, 1),
+                          'bytes_downloaded': follower.bytes_downloaded,
+                          'missing': follower.missing,
+                          'errors': follower.errors,
+                          'last_error': follower.last_error}))
+    except Exception:
+        sys.stderr.write(traceback.format_exc())
+        sys.exit(1)